@@ -1,50 +1,77 @@
-import random
-import matplotlib.pyplot as plt
-import base64
+from matplotlib.figure import Figure
 import io
-from flask import Flask, request, jsonify, render_template
+import json
+from flask import Flask, Response, abort, request, jsonify, render_template, url_for
+from chart_store import ChartStore
+from jobs import JobManager, QueueFull
+from result_cache import ResultCache, make_cache_key
+import ga_core
+from selection import SELECTION_METHODS
+from scalar_engine import CROSSOVER_OPERATORS
 
 app = Flask(__name__)
+job_manager = JobManager(max_workers=4, max_queued=32)
+result_cache = ResultCache(max_entries=256, ttl=3600)
+chart_store = ChartStore(max_bytes=32 * 1024 * 1024)
+
+def parse_number(value, name, convert):
+    # A malformed number is the client's mistake: answer 400 rather than fail with a 500
+    try:
+        return convert(value)
+    except ValueError:
+        abort(400, description=f"{name} must be {'an integer' if convert is int else 'a number'}, got {value!r}")
+
+def parse_ga_parameters(form):
+    population_size = parse_number(form['population_size'], "Population size", int)
+    if population_size < 2:
+        abort(400, description="Population size must be at least 2")
+    num_generations = parse_number(form['num_generations'], "Number of generations", int)
+    if num_generations < 0:
+        abort(400, description="Number of generations cannot be negative")
+    mutation_rate = parse_number(form['mutation_rate'], "Mutation rate", float)
+    crossover_rate = parse_number(form['crossover_rate'], "Crossover rate", float)
+    for name, rate in [("Mutation rate", mutation_rate), ("Crossover rate", crossover_rate)]:
+        if not 0 <= rate <= 1:
+            abort(400, description=f"{name} must be between 0 and 1")
+    selection_method = form['selection_method'].strip().lower()
+    if selection_method not in SELECTION_METHODS:
+        abort(400, description=f"Unknown selection method, expected one of {', '.join(SELECTION_METHODS)}")
+    tournament_size = parse_number(form.get('tournament_size') or 5, "Tournament size", int)
+    if tournament_size < 1:
+        abort(400, description="Tournament size must be at least 1")
+    crossover_operator = (form.get('crossover_operator') or 'blx').strip().lower()
+    if crossover_operator not in CROSSOVER_OPERATORS:
+        abort(400, description=f"Unknown crossover operator, expected one of {', '.join(CROSSOVER_OPERATORS)}")
+
+    return ga_core.ScalarConfig(
+        population_size=population_size,
+        num_generations=num_generations,
+        mutation_rate=mutation_rate,
+        crossover_rate=crossover_rate,
+        selection_method=selection_method,
+        tournament_size=tournament_size,
+        crossover_operator=crossover_operator,
+        elitism=form.get('elitism') == 'on',
+        seed=parse_number(form['seed'], "Seed", int) if form.get('seed') else None,
+    )
+
+def run_scalar_job(progress_callback=None, **values):
+    # Jobs are submitted as plain dicts (see jobs.JobManager.submit) and turned back into a config here
+    return ga_core.run_scalar(ga_core.ScalarConfig.from_dict(values), progress_callback)
+
+def render_fitness_chart(generations, best_fitness_values):
+    # Object-oriented Figure API: no pyplot global state shared between requests
+    figure = Figure(figsize=(8, 6))
+    ax = figure.subplots()
+    ax.plot(generations, best_fitness_values, marker='o', linestyle='-', color='b')
+    ax.set_xlabel("Generation")
+    ax.set_ylabel("Best Fitness Value")
+    ax.set_title("Fitness Value vs. Generation")
+    ax.grid(True)
 
-# Genetic Algorithm functions
-def create_individual():
-    return random.uniform(-10, 10)
-
-def create_initial_population(population_size):
-    return [create_individual() for _ in range(population_size)]
-
-def evaluate_fitness(individual):
-    x = individual
-    return x**2 + 5*x + 6
-
-def tournament_selection(population, num_selections):
-    selected_individuals = []
-    for _ in range(num_selections):
-        candidates = random.sample(population, 5)  # Tournament size of 5
-        selected_individuals.append(min(candidates, key=evaluate_fitness))
-    return selected_individuals
-
-def genetic_algorithm(population_size, num_generations, mutation_rate, crossover_rate, selection_method, elitism):
-    population = create_initial_population(population_size)
-    best_fitness_values = []
-    generations = list(range(num_generations + 1))
-
-    for generation in range(num_generations + 1):
-        selected_individuals = tournament_selection(population, num_selections=population_size)
-        new_population = []
-
-        while len(new_population) < population_size:
-            parent1, parent2 = random.sample(selected_individuals, 2)
-            child = (parent1 + parent2) / 2  # Simple average crossover
-
-            new_population.append(child)
-
-        population = new_population
-
-        best_individual = min(population, key=evaluate_fitness)
-        best_fitness_values.append(evaluate_fitness(best_individual))
-
-    return generations, best_fitness_values
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format='png')
+    return buffer.getvalue()
 
 @app.route('/')
 def index():
@@ -52,31 +79,96 @@ def index():
 
 @app.route('/run_genetic_algorithm', methods=['POST'])
 def run_genetic_algorithm():
-    population_size = int(request.form['population_size'])
-    num_generations = int(request.form['num_generations'])
-    mutation_rate = float(request.form['mutation_rate'])
-    crossover_rate = float(request.form['crossover_rate'])
-    selection_method = request.form['selection_method']
-    elitism = request.form.get('elitism') == 'on'
-
-    generations, best_fitness_values = genetic_algorithm(population_size, num_generations, mutation_rate, crossover_rate, selection_method, elitism)
-
-    plt.figure(figsize=(8, 6))
-    plt.plot(generations, best_fitness_values, marker='o', linestyle='-', color='b')
-    plt.xlabel("Generation")
-    plt.ylabel("Best Fitness Value")
-    plt.title("Fitness Value vs. Generation")
-    plt.grid(True)
-
-    # Convert the plot to a base64 string
-    buffer = io.BytesIO()
-    plt.savefig(buffer, format='png')
-    buffer.seek(0)
-    plot_data = base64.b64encode(buffer.read()).decode('utf-8')
-
-    plt.close()
-
-    return jsonify(plot_data=plot_data, best_fitness_values=best_fitness_values)
+    config = parse_ga_parameters(request.form)
+
+    # Only seeded runs are repeatable, so only those are worth caching
+    cache_key = make_cache_key(config.to_dict()) if config.seed is not None else None
+    result = result_cache.get(cache_key) if cache_key is not None else None
+    if result is None:
+        generations, best_fitness_values = ga_core.run_scalar(config)
+        result = {'generations': generations, 'best_fitness_values': best_fitness_values}
+        if cache_key is not None:
+            result_cache.put(cache_key, result)
+
+    # The series alone is enough for the browser to draw the chart; the PNG is opt-in
+    if request.values.get('render') != 'png':
+        return jsonify(best_fitness_values=result['best_fitness_values'])
+
+    # Charts are served by URL so browsers and caches can reuse them
+    if result.get('chart_digest') is None or chart_store.get(result['chart_digest']) is None:
+        chart = render_fitness_chart(result['generations'], result['best_fitness_values'])
+        result['chart_digest'] = chart_store.put(chart)
+    plot_url = url_for('chart', digest=result['chart_digest'])
+    return jsonify(plot_url=plot_url, best_fitness_values=result['best_fitness_values'])
+
+@app.route('/charts/<digest>.png', methods=['GET'])
+def chart(digest):
+    png = chart_store.get(digest)
+    if png is None:
+        abort(404)
+
+    # The URL names the content, so it can never change underneath a cached copy
+    response = Response(png, mimetype='image/png')
+    response.set_etag(digest)
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response.make_conditional(request)
+
+@app.route('/cache_stats', methods=['GET'])
+def cache_stats():
+    return jsonify(results=result_cache.stats(), charts=chart_store.stats())
+
+# Server-Sent Events: one event per generation while the run is in progress
+@app.route('/run_genetic_algorithm/stream', methods=['GET'])
+def stream_genetic_algorithm():
+    config = parse_ga_parameters(request.args)
+
+    def events():
+        for statistics in ga_core.evolve_scalar(config):
+            yield f"data: {json.dumps(statistics)}\n\n"
+        yield "event: done\ndata: {}\n\n"
+
+    return Response(events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+# Job API: submit a run, poll its progress, fetch the series once it is done
+@app.route('/jobs', methods=['POST'])
+def submit_job():
+    config = parse_ga_parameters(request.form)
+    try:
+        job = job_manager.submit(run_scalar_job, config.to_dict())
+    except QueueFull:
+        return jsonify(error="Too many jobs queued, try again later"), 503
+
+    return jsonify(job_id=job.id,
+                   status_url=url_for('job_status', job_id=job.id),
+                   result_url=url_for('job_result', job_id=job.id)), 202
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify(error="Unknown job"), 404
+    return jsonify(job.to_dict())
+
+@app.route('/jobs/<job_id>/result', methods=['GET'])
+def job_result(job_id):
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify(error="Unknown job"), 404
+    if job.status in ('queued', 'running'):
+        return jsonify(job.to_dict()), 202
+    if job.status != 'done':
+        return jsonify(job.to_dict()), 409
+
+    generations, best_fitness_values = job.result
+    return jsonify(generations=generations, best_fitness_values=best_fitness_values)
+
+@app.route('/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    job = job_manager.cancel(job_id)
+    if job is None:
+        return jsonify(error="Unknown job"), 404
+    return jsonify(job.to_dict())
 
 if __name__ == '__main__':
     app.run(debug=True)
@@ -0,0 +1,125 @@
+import asyncio
+import random
+import threading
+
+import numpy as np
+
+from objectives import as_batch, resolve_objective
+
+# Asynchronous evaluation for fitness functions that wait on something else, such as a
+# simulator service reached over HTTP/RPC. AsyncObjective turns an async per-individual
+# score function into an ordinary batch objective: a generation is scored with up to
+# `concurrency` requests in flight, so it takes about (population / concurrency)
+# round trips instead of one round trip per individual. Pass it to the engines in
+# place of an objective name:
+#
+#   objective = AsyncObjective(client.score, concurrency=32, timeout=5.0, retries=2)
+#   ga_core.run(ga_core.GAConfig(selected_function=objective, bounds=...))
+#
+# The objective runs its own event loop on a background thread and can be called from
+# several threads at once; all calls share the one concurrency limit. Use it with the
+# "serial" or "threads" evaluation backend (it cannot be sent to worker processes).
+# The steady-state engines score only a few offspring per call, so they need the
+# "threads" backend with at least max_pending workers to keep several batches in
+# flight. ga_core.run() checks both. LocalSimulator is a stand-in service for trying
+# this without one.
+
+class EvaluationFailed(Exception):
+    pass
+
+class AsyncObjective:
+    def __init__(self, score, concurrency=16, timeout=None, retries=0, retry_delay=0.1,
+                 retry_on=(asyncio.TimeoutError, OSError), failure_fitness=None):
+        # score: async function taking one individual (a 1-D array) and returning its fitness
+        # timeout: seconds allowed per attempt, None for no limit
+        # retries: extra attempts after a timeout or one of retry_on; the delay doubles each time
+        # failure_fitness: fitness given to an individual that still fails, None to raise EvaluationFailed
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.score = score
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.retry_on = retry_on
+        self.failure_fitness = failure_fitness
+        self.semaphore = None
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        # Counters over the objective's lifetime
+        self.attempts = 0
+        self.failures = 0
+
+    async def score_individual(self, individual):
+        for attempt in range(self.retries + 1):
+            # The slot is released while waiting to retry, so other individuals can use it
+            async with self.semaphore:
+                self.attempts += 1
+                try:
+                    return await asyncio.wait_for(self.score(individual), self.timeout)
+                except self.retry_on as error:
+                    last_error = error
+            if attempt < self.retries:
+                await asyncio.sleep(self.retry_delay * 2**attempt)
+
+        self.failures += 1
+        if self.failure_fitness is None:
+            raise EvaluationFailed(f"Evaluation failed after {self.retries + 1} attempts") from last_error
+        return self.failure_fitness
+
+    async def score_population(self, population):
+        if self.semaphore is None:
+            # Created on the loop's own thread; shared by every call
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [asyncio.ensure_future(self.score_individual(individual)) for individual in population]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            # One individual failed for good; stop the others before the error propagates
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def __call__(self, population):
+        future = asyncio.run_coroutine_threadsafe(self.score_population(as_batch(population)), self.loop)
+        return np.array(future.result(), dtype=float)
+
+    def close(self):
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class LocalSimulator:
+    # Stand-in for a remote simulator: scores one of the objectives.OBJECTIVES after a
+    # random round-trip delay, and can be made to fail or hang now and then
+    def __init__(self, selected_function, dimension, latency=0.05, jitter=0.0, failure_rate=0.0, hang_rate=0.0,
+                 seed=None):
+        self.objective = resolve_objective(selected_function, dimension)
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.hang_rate = hang_rate
+        self.rng = random.Random(seed)
+        self.calls = 0
+
+    async def score(self, individual):
+        self.calls += 1
+        draw = self.rng.random()
+        delay = self.latency + self.rng.uniform(0, self.jitter)
+        if draw < self.hang_rate:
+            # Never answers; only a timeout gets the caller out
+            await asyncio.Event().wait()
+        await asyncio.sleep(delay)
+        if draw < self.hang_rate + self.failure_rate:
+            raise ConnectionError("Simulator connection reset")
+        return float(self.objective(individual[None, :])[0])
@@ -0,0 +1,42 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Content-addressed store for rendered chart PNGs. Charts are keyed by the SHA-256 of
+# their bytes, so the key doubles as a strong ETag, and the least recently used
+# charts are evicted once the store grows past its byte budget.
+
+class ChartStore:
+    def __init__(self, max_bytes=32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.charts = OrderedDict()
+        self.lock = threading.Lock()
+
+    def put(self, png):
+        digest = hashlib.sha256(png).hexdigest()
+        with self.lock:
+            if digest in self.charts:
+                self.charts.move_to_end(digest)
+                return digest
+            self.charts[digest] = png
+            self.total_bytes += len(png)
+            while self.total_bytes > self.max_bytes and len(self.charts) > 1:
+                _, evicted = self.charts.popitem(last=False)
+                self.total_bytes -= len(evicted)
+        return digest
+
+    def get(self, digest):
+        with self.lock:
+            png = self.charts.get(digest)
+            if png is not None:
+                self.charts.move_to_end(digest)
+            return png
+
+    def stats(self):
+        with self.lock:
+            return {
+                "size": len(self.charts),
+                "total_bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,42 @@
+import time
+
+# Termination criteria for the minimizing GA loops. update() is called once per
+# generation and returns the reason to stop, or None to keep going.
+
+TARGET_REACHED = "target fitness reached"
+STAGNATION = "no improvement"
+TIME_BUDGET = "wall-clock budget exhausted"
+EVALUATION_BUDGET = "evaluation budget exhausted"
+MAX_GENERATIONS = "maximum generations reached"
+
+class StoppingCriteria:
+    def __init__(self, patience=None, tolerance=0.0, target_fitness=None, max_seconds=None, max_evaluations=None):
+        # patience: generations without an improvement larger than tolerance before stopping
+        self.patience = patience
+        self.tolerance = tolerance
+        self.target_fitness = target_fitness
+        self.max_seconds = max_seconds
+        self.max_evaluations = max_evaluations
+        self.start()
+
+    def start(self):
+        self.start_time = time.monotonic()
+        self.best_fitness = None
+        self.stale_generations = 0
+
+    def update(self, best_fitness, evaluations):
+        if self.best_fitness is None or self.best_fitness - best_fitness > self.tolerance:
+            self.best_fitness = best_fitness
+            self.stale_generations = 0
+        else:
+            self.stale_generations += 1
+
+        if self.target_fitness is not None and best_fitness <= self.target_fitness:
+            return TARGET_REACHED
+        if self.patience and self.stale_generations >= self.patience:
+            return STAGNATION
+        if self.max_seconds is not None and time.monotonic() - self.start_time >= self.max_seconds:
+            return TIME_BUDGET
+        if self.max_evaluations is not None and evaluations >= self.max_evaluations:
+            return EVALUATION_BUDGET
+        return None
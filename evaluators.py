@@ -0,0 +1,78 @@
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+# Fitness evaluation backends. A generation is split into chunks and the chunks are
+# spread across workers; results always come back in population order, so a run
+# under a fixed seed gives the same answer whatever the backend or worker count.
+
+EVALUATION_BACKENDS = ["serial", "threads", "processes"]
+
+def split_into_chunks(population, chunk_size):
+    return [population[i:i + chunk_size] for i in range(0, len(population), chunk_size)]
+
+def process_context():
+    # Forking a process that has other threads running (a Tk app with a BackgroundRunner,
+    # a Flask server) can copy locks held by those threads into the child. The fork
+    # server is forked once, before any of that, and starts every worker; elsewhere the
+    # platform default (spawn) is already safe. Either way workers import the caller's
+    # modules afresh, so scripts that use a pool need an `if __name__ == "__main__"` guard.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context()
+
+def process_pool(workers):
+    return ProcessPoolExecutor(max_workers=workers, mp_context=process_context())
+
+class Evaluator:
+    def __init__(self, backend="serial", workers=None, chunk_size=None):
+        if backend not in EVALUATION_BACKENDS:
+            raise ValueError(f"Unknown evaluation backend: {backend}")
+        self.backend = backend
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        self.executor = None
+
+        if backend == "threads":
+            self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        elif backend == "processes":
+            self.executor = process_pool(self.workers)
+
+    def split(self, population):
+        # A few chunks per worker keeps the workers busy without paying per-individual overhead
+        chunk_size = self.chunk_size or max(1, -(-len(population) // (self.workers * 4)))
+        return split_into_chunks(population, chunk_size)
+
+    def map_chunks(self, chunk_function, population):
+        if self.executor is None:
+            return [chunk_function(population)]
+        return list(self.executor.map(chunk_function, self.split(population)))
+
+    def evaluate_batch(self, batch_function, population):
+        # Objectives are vectorized and score a whole array (or chunk) of individuals at once
+        return np.concatenate(self.map_chunks(batch_function, population))
+
+    def submit_batch(self, batch_function, population):
+        # A Future for one small batch, so the caller can keep working while it is scored.
+        # Serial evaluation scores it right away and hands back a finished Future.
+        if self.executor is not None:
+            return self.executor.submit(batch_function, population)
+        future = Future()
+        try:
+            future.set_result(batch_function(population))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,207 @@
+import argparse
+import csv
+import json
+import sys
+import time
+
+import ga_core
+import islands
+from evaluators import EVALUATION_BACKENDS, process_pool
+from objectives import resolve_objective
+
+# Command-line batch runner for the continuous GA. Runs one GAConfig many times under
+# different seeds, optionally across a process pool, and writes the statistics of every
+# generation as JSON lines or CSV. Nothing here imports tkinter or matplotlib.
+#
+#   python ga_batch.py --config run.json --runs 20 --seed 1 --jobs 8 --output stats.csv
+#
+# The config file is a JSON object with GAConfig's fields; flags override it.
+
+ENCODING_SCHEMES = ["Real-Valued", "Binary"]
+CROSSOVER_OPERATORS = ["Single-Point", "Multi-Point"]
+MUTATION_OPERATORS = ["Bit Flip", "Random Value Change"]
+
+STAT_FIELDS = ["run", "seed", "generation", "best_fitness", "elapsed_seconds"]
+
+# flag destination -> GAConfig field
+CONFIG_FLAGS = {
+    "population_size": "population_size",
+    "generations": "num_generations",
+    "encoding": "encoding_scheme",
+    "function": "selected_function",
+    "crossover_rate": "crossover_rate",
+    "mutation_rate": "mutation_rate",
+    "crossover_operator": "crossover_operator",
+    "mutation_operator": "mutation_operator",
+    "elitism": "elitism",
+    "bits_per_variable": "bits_per_variable",
+    "tournament_size": "tournament_size",
+    "engine": "engine",
+    "evaluation_backend": "evaluation_backend",
+    "workers": "workers",
+    "patience": "patience",
+    "tolerance": "tolerance",
+    "target_fitness": "target_fitness",
+    "max_seconds": "max_seconds",
+    "max_evaluations": "max_evaluations",
+}
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Run the GA many times and record per-generation statistics.")
+    parser.add_argument("--config", help="JSON file with GAConfig fields")
+    parser.add_argument("--runs", type=int, default=1, help="number of runs (default 1)")
+    parser.add_argument("--seed", type=int, help="base seed; every run gets its own seed derived from it")
+    parser.add_argument("--jobs", type=int, default=1, help="runs executed in parallel processes (default 1)")
+    parser.add_argument("--output", default="-", help="statistics file, - for stdout (default)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], help="output format (default: from --output, else jsonl)")
+
+    problem = parser.add_argument_group("problem (overrides the config file)")
+    problem.add_argument("--function", help='objective, e.g. "Rastrigin Function"')
+    problem.add_argument("--dimensions", type=int, help="number of variables, all sharing --lower/--upper")
+    problem.add_argument("--lower", type=float, default=-10.0, help="lower bound of every variable (default -10)")
+    problem.add_argument("--upper", type=float, default=10.0, help="upper bound of every variable (default 10)")
+    problem.add_argument("--encoding", choices=ENCODING_SCHEMES)
+    problem.add_argument("--bits-per-variable", type=int)
+
+    ga = parser.add_argument_group("GA (overrides the config file)")
+    ga.add_argument("--population-size", type=int)
+    ga.add_argument("--generations", type=int)
+    ga.add_argument("--crossover-rate", type=float)
+    ga.add_argument("--mutation-rate", type=float)
+    ga.add_argument("--crossover-operator", choices=CROSSOVER_OPERATORS)
+    ga.add_argument("--mutation-operator", choices=MUTATION_OPERATORS)
+    ga.add_argument("--elitism", action=argparse.BooleanOptionalAction)
+    ga.add_argument("--tournament-size", type=int)
+    ga.add_argument("--engine", choices=list(ga_core.ENGINES))
+    ga.add_argument("--evaluation-backend", choices=EVALUATION_BACKENDS)
+    ga.add_argument("--workers", type=int)
+
+    island = parser.add_argument_group("island model")
+    island.add_argument("--islands", type=int, default=1, help="islands per run, each in its own process (default 1)")
+    island.add_argument("--migration-interval", type=int, default=10, help="generations between migrations (default 10)")
+    island.add_argument("--migrants", type=int, default=2, help="individuals each island sends per migration (default 2)")
+    island.add_argument("--topology", choices=islands.TOPOLOGIES, default="ring")
+
+    stopping = parser.add_argument_group("early stopping (overrides the config file, ignored with --islands)")
+    stopping.add_argument("--patience", type=int)
+    stopping.add_argument("--tolerance", type=float)
+    stopping.add_argument("--target-fitness", type=float)
+    stopping.add_argument("--max-seconds", type=float)
+    stopping.add_argument("--max-evaluations", type=int)
+    return parser
+
+def config_values(args):
+    values = {}
+    if args.config:
+        with open(args.config) as config_file:
+            values.update(json.load(config_file))
+    for flag, field in CONFIG_FLAGS.items():
+        if getattr(args, flag) is not None:
+            values[field] = getattr(args, flag)
+    if args.dimensions is not None:
+        values["bounds"] = [(args.lower, args.upper)] * args.dimensions
+    values.pop("seed", None)
+    return values
+
+def validate_config(config):
+    # Settings the engines would only reject inside a (worker) run, or silently ignore.
+    # The config file bypasses the flag choices, so everything is checked here.
+    resolve_objective(config.selected_function, len(config.bounds))
+    for name, value, allowed in [("encoding_scheme", config.encoding_scheme, ENCODING_SCHEMES),
+                                 ("crossover_operator", config.crossover_operator, CROSSOVER_OPERATORS),
+                                 ("mutation_operator", config.mutation_operator, MUTATION_OPERATORS),
+                                 ("evaluation_backend", config.evaluation_backend, EVALUATION_BACKENDS)]:
+        if value not in allowed:
+            raise ValueError(f"unknown {name} {value!r}, expected one of {', '.join(allowed)}")
+    # Every engine breeds a population of one (the parent pairs with itself), none an empty one
+    for name, value in [("population_size", config.population_size),
+                        ("tournament_size", config.tournament_size),
+                        ("bits_per_variable", config.bits_per_variable)]:
+        if value < 1:
+            raise ValueError(f"{name} must be at least 1, got {value}")
+
+def run_once(run, seed, values, island_options=None):
+    config = ga_core.GAConfig.from_dict(dict(values, seed=seed))
+    rows = []
+    start = time.perf_counter()
+
+    def record(generation, best_fitness, best_individual):
+        rows.append({
+            "run": run,
+            "seed": seed,
+            "generation": generation,
+            "best_fitness": best_fitness,
+            "elapsed_seconds": time.perf_counter() - start,
+        })
+
+    if island_options is None:
+        generations, best_fitness_values, best_individuals, stop_reason = ga_core.run(config, progress_callback=record)
+    else:
+        # Rows are recorded after the islands finish, so elapsed_seconds is not meaningful here
+        generations, best_fitness_values, best_individuals, stop_reason = islands.run_islands(
+            config, progress_callback=record, **island_options)
+    summary = {
+        "run": run,
+        "seed": seed,
+        "generations": len(generations),
+        "best_fitness": min(best_fitness_values) if best_fitness_values else None,
+        "stop_reason": stop_reason,
+    }
+    return rows, summary
+
+def open_writer(output, output_format):
+    if output_format == "csv":
+        writer = csv.DictWriter(output, fieldnames=STAT_FIELDS)
+        writer.writeheader()
+        return writer.writerows
+    return lambda rows: output.writelines(json.dumps(row) + "\n" for row in rows)
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.runs < 1 or args.jobs < 1:
+        parser.error("--runs and --jobs must be at least 1")
+
+    values = config_values(args)
+    try:
+        validate_config(ga_core.GAConfig.from_dict(values))
+    except (TypeError, ValueError) as error:
+        parser.error(f"invalid config: {error}")
+
+    island_options = None
+    if args.islands > 1:
+        island_options = {"num_islands": args.islands, "interval": args.migration_interval,
+                          "migrants": args.migrants, "topology": args.topology}
+
+    output_format = args.format or ("csv" if args.output.endswith(".csv") else "jsonl")
+    seeds = ga_core.derive_seeds(args.seed, args.runs)
+    output = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    executor = None
+    try:
+        write_rows = open_writer(output, output_format)
+        if args.jobs == 1:
+            results = (run_once(run, seed, values, island_options) for run, seed in enumerate(seeds))
+        else:
+            executor = process_pool(args.jobs)
+            results = executor.map(run_once, range(args.runs), seeds, [values] * args.runs,
+                                   [island_options] * args.runs)
+
+        # Results are written in run order as they complete
+        for rows, summary in results:
+            write_rows(rows)
+            output.flush()
+            if summary["best_fitness"] is None:
+                best = "no result"
+            else:
+                best = f"best fitness {summary['best_fitness']:.6g}"
+            print(f"run {summary['run']} (seed {summary['seed']}): {best} "
+                  f"after {summary['generations']} generations, {summary['stop_reason']}", file=sys.stderr)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
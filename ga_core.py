@@ -0,0 +1,180 @@
+from functools import partial
+
+import numpy as np
+
+import knapsack_engine
+import knapsack_list_engine
+import list_engine
+import population_engine
+import scalar_engine
+import steady_state
+from async_evaluation import AsyncObjective
+from convergence import StoppingCriteria
+from evaluators import Evaluator
+
+# Headless entry point to the GA engines. Nothing here (or in the engine modules it
+# imports) touches tkinter or matplotlib, so the GUIs, the Flask app, worker processes
+# and scripts can all import it cheaply. A run is described by a config object and
+# started with run() / run_knapsack().
+
+ENGINES = {
+    "Python": list_engine.genetic_algorithm,
+    "NumPy": population_engine.genetic_algorithm,
+    "NumPy (double-buffered)": partial(population_engine.genetic_algorithm, double_buffered=True),
+    "Steady-state (replace worst)": steady_state.genetic_algorithm,
+    "Steady-state (replace random)": partial(steady_state.genetic_algorithm, replacement=steady_state.REPLACE_RANDOM),
+}
+
+def derive_seeds(seed, count):
+    # Independent child seeds of one base seed, one per run/island/configuration, so that
+    # results do not depend on how the work is spread over processes
+    return [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(count)]
+
+# Engines that score a few offspring at a time instead of whole generations
+STEADY_STATE_ENGINES = ["Steady-state (replace worst)", "Steady-state (replace random)"]
+
+class GAConfig:
+    # Continuous optimization of one of the objectives.OBJECTIVES over a box of bounds
+    def __init__(self, population_size=100, num_generations=100, encoding_scheme="Real-Valued",
+                 selected_function="Sphere Function", crossover_rate=0.8, mutation_rate=0.1,
+                 crossover_operator="Single-Point", mutation_operator="Random Value Change", elitism=False,
+                 bounds=None, bits_per_variable=16, tournament_size=5, seed=None, engine="NumPy",
+                 evaluation_backend="serial", workers=None, patience=None, tolerance=0.0, target_fitness=None,
+                 max_seconds=None, max_evaluations=None):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine: {engine}")
+        self.population_size = population_size
+        self.num_generations = num_generations
+        self.encoding_scheme = encoding_scheme
+        self.selected_function = selected_function
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.crossover_operator = crossover_operator
+        self.mutation_operator = mutation_operator
+        self.elitism = elitism
+        # One (lower, upper) pair per variable
+        self.bounds = [tuple(pair) for pair in bounds] if bounds is not None else [(-10, 10), (-10, 10)]
+        self.bits_per_variable = bits_per_variable
+        self.tournament_size = tournament_size
+        self.seed = seed
+        self.engine = engine
+        self.evaluation_backend = evaluation_backend
+        self.workers = workers
+        # Early stopping, see convergence.StoppingCriteria; all None means run every generation
+        self.patience = patience
+        self.tolerance = tolerance
+        self.target_fitness = target_fitness
+        self.max_seconds = max_seconds
+        self.max_evaluations = max_evaluations
+
+    @classmethod
+    def from_dict(cls, values):
+        return cls(**values)
+
+    def to_dict(self):
+        return dict(vars(self))
+
+    def stopping_criteria(self):
+        return StoppingCriteria(patience=self.patience, tolerance=self.tolerance, target_fitness=self.target_fitness,
+                                max_seconds=self.max_seconds, max_evaluations=self.max_evaluations)
+
+class KnapsackConfig:
+    # 0/1 knapsack over items given as (weight, value) pairs
+    def __init__(self, items, capacity, population_size=100, num_generations=100, mutation_rate=0.1,
+                 tournament_size=5, seed=None, packed=False, evaluation_backend="serial", workers=None):
+        self.items = [tuple(item) for item in items]
+        self.capacity = capacity
+        self.population_size = population_size
+        self.num_generations = num_generations
+        self.mutation_rate = mutation_rate
+        self.tournament_size = tournament_size
+        self.seed = seed
+        # Bit-packed NumPy genomes (knapsack_engine) instead of lists of 0/1 (knapsack_list_engine)
+        self.packed = packed
+        self.evaluation_backend = evaluation_backend
+        self.workers = workers
+
+    @classmethod
+    def from_dict(cls, values):
+        return cls(**values)
+
+    def to_dict(self):
+        return dict(vars(self))
+
+class ScalarConfig:
+    # The one-variable quadratic of scalar_engine.py, as served by app.py
+    def __init__(self, population_size=100, num_generations=100, mutation_rate=0.1, crossover_rate=0.8,
+                 selection_method="tournament", elitism=False, seed=None, tournament_size=5, crossover_operator="blx"):
+        self.population_size = population_size
+        self.num_generations = num_generations
+        self.mutation_rate = mutation_rate
+        self.crossover_rate = crossover_rate
+        # One of selection.SELECTION_METHODS
+        self.selection_method = selection_method
+        self.elitism = elitism
+        self.seed = seed
+        self.tournament_size = tournament_size
+        # One of scalar_engine.CROSSOVER_OPERATORS
+        self.crossover_operator = crossover_operator
+
+    @classmethod
+    def from_dict(cls, values):
+        return cls(**values)
+
+    def to_dict(self):
+        return dict(vars(self))
+
+def run(config, progress_callback=None, evaluator=None, migration=None):
+    # Returns (generations, best_fitness_values, best_individuals, stop_reason).
+    # Without an evaluator one is built from the config and closed when the run ends.
+    # migration is the per-generation hook of an island run (islands.py).
+    check_async_objective(config)
+    if evaluator is None:
+        with Evaluator(config.evaluation_backend, config.workers) as evaluator:
+            return run(config, progress_callback, evaluator, migration)
+
+    return ENGINES[config.engine](
+        config.population_size, config.num_generations, config.encoding_scheme, config.selected_function,
+        config.crossover_rate, config.mutation_rate, config.crossover_operator, config.mutation_operator,
+        config.elitism, config.bounds, seed=config.seed, evaluator=evaluator, progress_callback=progress_callback,
+        stopping_criteria=config.stopping_criteria(), tournament_size=config.tournament_size,
+        bits_per_variable=config.bits_per_variable, migration=migration)
+
+def check_async_objective(config):
+    # An AsyncObjective keeps its requests in flight on its own event loop thread, see async_evaluation.py
+    if not isinstance(config.selected_function, AsyncObjective):
+        return
+    if config.evaluation_backend == "processes":
+        raise ValueError("An AsyncObjective cannot be sent to worker processes; use the serial or threads backend")
+    if config.engine in STEADY_STATE_ENGINES and config.evaluation_backend != "threads":
+        raise ValueError("Steady-state engines score a few offspring per call; use the threads backend so several "
+                         "batches of an AsyncObjective are in flight at once")
+
+def run_knapsack(config, evaluator=None, cancel_event=None):
+    # Returns (generations, best_fitness_values, best_individual, best_fitness), or None if
+    # cancel_event was set before a list-based run finished
+    if evaluator is None:
+        with Evaluator(config.evaluation_backend, config.workers) as evaluator:
+            return run_knapsack(config, evaluator, cancel_event)
+
+    if config.packed:
+        return knapsack_engine.genetic_algorithm(
+            config.items, config.capacity, config.population_size, config.num_generations, config.mutation_rate,
+            seed=config.seed, evaluator=evaluator, tournament_size=config.tournament_size)
+    return knapsack_list_engine.genetic_algorithm(
+        config.items, config.capacity, config.population_size, config.num_generations, config.mutation_rate,
+        seed=config.seed, evaluator=evaluator, tournament_size=config.tournament_size, cancel_event=cancel_event)
+
+def run_scalar(config, progress_callback=None):
+    # Returns (generations, best_fitness_values); progress_callback(generation, best_fitness)
+    return scalar_engine.genetic_algorithm(
+        config.population_size, config.num_generations, config.mutation_rate, config.crossover_rate,
+        config.selection_method, config.elitism, seed=config.seed, tournament_size=config.tournament_size,
+        crossover_operator=config.crossover_operator, progress_callback=progress_callback)
+
+def evolve_scalar(config):
+    # Yields the statistics of each generation as it is evaluated, see scalar_engine.generation_statistics
+    return scalar_engine.evolve(
+        config.population_size, config.num_generations, config.mutation_rate, config.crossover_rate,
+        config.selection_method, config.elitism, seed=config.seed, tournament_size=config.tournament_size,
+        crossover_operator=config.crossover_operator)
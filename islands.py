@@ -0,0 +1,110 @@
+from concurrent.futures import FIRST_EXCEPTION, wait
+
+import numpy as np
+
+import ga_core
+from convergence import MAX_GENERATIONS
+from evaluators import process_context, process_pool
+
+# Island model for the continuous GA. Every island is an ordinary ga_core.run() in its
+# own process, with its own population and seed. Every `interval` generations each
+# island sends copies of its best `migrants` individuals to its neighbours in the
+# topology and replaces its worst individuals with the ones it receives.
+
+TOPOLOGIES = ["ring", "fully connected"]
+
+def migration_targets(island, num_islands, topology):
+    if topology == "ring":
+        return [(island + 1) % num_islands]
+    elif topology == "fully connected":
+        return [other for other in range(num_islands) if other != island]
+    raise ValueError(f"Unknown topology: {topology}")
+
+class Migration:
+    # The migration hook of one island, called by the engine after every evaluation.
+    # Islands block on their inbox until every neighbour has sent its migrants, so all
+    # islands move in lockstep from one migration to the next.
+    def __init__(self, island, inboxes, targets, num_sources, interval, migrants):
+        self.island = island
+        self.inboxes = inboxes
+        self.targets = targets
+        self.num_sources = num_sources
+        self.interval = interval
+        self.migrants = migrants
+        # Messages that arrived early, from neighbours already at a later migration
+        self.pending = []
+
+    def __call__(self, generation, population, fitness):
+        if (generation + 1) % self.interval != 0:
+            return
+        order = np.argsort(fitness, kind="stable")
+        emigrants = [(population[i], fitness[i]) for i in order[:self.migrants]]
+        for target in self.targets:
+            self.inboxes[target].put((generation, self.island, emigrants))
+
+        messages = [message for message in self.pending if message[0] == generation]
+        self.pending = [message for message in self.pending if message[0] != generation]
+        while len(messages) < self.num_sources:
+            message = self.inboxes[self.island].get()
+            if message is None:
+                raise RuntimeError("Island run aborted")
+            if message[0] == generation:
+                messages.append(message)
+            else:
+                self.pending.append(message)
+
+        # Sorted by sender so the result does not depend on arrival order
+        immigrants = [migrant for _, source, sent in sorted(messages, key=lambda message: message[1]) for migrant in sent]
+        for i, (individual, individual_fitness) in zip(order[::-1], immigrants):
+            population[i] = individual
+            fitness[i] = individual_fitness
+
+def run_island(config_values, migration):
+    return ga_core.run(ga_core.GAConfig.from_dict(config_values), migration=migration)
+
+def run_islands(config, num_islands=4, interval=10, migrants=2, topology="ring", progress_callback=None):
+    # config.population_size is the size of each island. Returns the same tuple as
+    # ga_core.run(), following the best island in every generation.
+    # Islands have to reach every migration together, so the early-stopping fields of
+    # the config are not used; each island runs config.num_generations generations.
+    if num_islands < 2:
+        raise ValueError("An island run needs at least 2 islands")
+    if interval < 1 or migrants < 1:
+        raise ValueError("interval and migrants must be at least 1")
+    targets = [migration_targets(island, num_islands, topology) for island in range(num_islands)]
+    num_sources = [sum(island in island_targets for island_targets in targets) for island in range(num_islands)]
+    if max(num_sources) * migrants >= config.population_size:
+        raise ValueError("Too many migrants for the island population size")
+
+    values = config.to_dict()
+    values.update(patience=None, target_fitness=None, max_seconds=None, max_evaluations=None)
+    seeds = ga_core.derive_seeds(config.seed, num_islands)
+
+    # Manager queues can be handed to pool workers; every island also needs all of
+    # them running at once, hence one worker per island
+    with process_context().Manager() as manager, process_pool(num_islands) as executor:
+        inboxes = [manager.Queue() for _ in range(num_islands)]
+        futures = [executor.submit(run_island, dict(values, seed=seed),
+                                   Migration(island, inboxes, targets[island], num_sources[island], interval, migrants))
+                   for island, seed in enumerate(seeds)]
+        done, not_done = wait(futures, return_when=FIRST_EXCEPTION)
+        if not_done:
+            # One island failed; wake the others up so they do not wait for it forever
+            for inbox in inboxes:
+                for _ in range(num_islands):
+                    inbox.put(None)
+            for future in done:
+                future.result()  # Raises the island's own error rather than the others' aborts
+        results = [future.result() for future in futures]
+
+    generations = results[0][0]
+    best_fitness_values = []
+    best_individuals = []
+    for generation in generations:
+        best_island = min(results, key=lambda result: result[1][generation])
+        best_fitness_values.append(best_island[1][generation])
+        best_individuals.append(best_island[2][generation])
+        if progress_callback is not None:
+            # Reported once the islands have finished, not while they run
+            progress_callback(generation, best_fitness_values[-1], best_individuals[-1])
+    return generations, best_fitness_values, best_individuals, MAX_GENERATIONS
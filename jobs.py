@@ -0,0 +1,106 @@
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Background GA runs for the Flask app. Jobs run on a bounded worker pool, a bounded
+# number may wait in the queue, and a running job is cancelled at its next
+# generation boundary through its progress callback.
+
+class JobCancelled(Exception):
+    pass
+
+class QueueFull(Exception):
+    pass
+
+class Job:
+    def __init__(self, job_id, num_generations=None):
+        self.id = job_id
+        self.status = "queued"
+        self.num_generations = num_generations
+        self.generation = None
+        self.best_fitness = None
+        self.result = None
+        self.error = None
+        self.cancel_event = threading.Event()
+        self.future = None
+
+    def report_progress(self, generation, best_fitness):
+        if self.cancel_event.is_set():
+            raise JobCancelled()
+        self.generation = generation
+        self.best_fitness = best_fitness
+
+    def finished(self):
+        return self.status in ("done", "failed", "cancelled")
+
+    def to_dict(self):
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "generation": self.generation,
+            "num_generations": self.num_generations,
+            "best_fitness": self.best_fitness,
+            "error": self.error,
+        }
+
+class JobManager:
+    def __init__(self, max_workers=4, max_queued=32, max_finished=256):
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.max_finished = max_finished
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ga-job")
+        self.jobs = OrderedDict()
+        self.lock = threading.Lock()
+
+    def submit(self, function, parameters):
+        # function(**parameters) must accept a progress_callback(generation, best_fitness) keyword
+        with self.lock:
+            pending = sum(1 for job in self.jobs.values() if not job.finished())
+            if pending >= self.max_workers + self.max_queued:
+                raise QueueFull()
+            job = Job(uuid.uuid4().hex, parameters.get("num_generations"))
+            self.jobs[job.id] = job
+            self.prune()
+        job.future = self.executor.submit(self.run, job, function, parameters)
+        return job
+
+    def run(self, job, function, parameters):
+        if job.cancel_event.is_set():
+            job.status = "cancelled"
+            return
+        job.status = "running"
+        try:
+            job.result = function(progress_callback=job.report_progress, **parameters)
+        except JobCancelled:
+            job.status = "cancelled"
+        except Exception as error:
+            job.error = str(error)
+            job.status = "failed"
+        else:
+            job.status = "done"
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def cancel(self, job_id):
+        job = self.get(job_id)
+        if job is None:
+            return None
+        job.cancel_event.set()
+        if job.future is not None and job.future.cancel():
+            # Never started, so run() will not get the chance to update the status
+            job.status = "cancelled"
+        return job
+
+    def prune(self):
+        # Forget the oldest finished jobs once too many results are being kept around
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished()]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self.jobs[job_id]
+
+    def shutdown(self):
+        for job in list(self.jobs.values()):
+            job.cancel_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
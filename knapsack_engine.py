@@ -0,0 +1,154 @@
+from functools import partial
+
+import numpy as np
+
+from evaluators import Evaluator
+from selection import tournament_indices
+
+# Bit-packed knapsack GA. Each chromosome is a row of uint8 bytes holding one bit per
+# item (np.packbits order: item 0 is the high bit of byte 0), so crossover and
+# mutation are byte-wide mask operations and fitness is a dot product.
+
+def packed_length(num_items):
+    return (num_items + 7) // 8
+
+def tail_mask(num_items):
+    # Bits of the last byte that correspond to real items
+    used_bits = num_items % 8 or 8
+    return np.uint8((0xFF << (8 - used_bits)) & 0xFF)
+
+def pack_individuals(individuals):
+    return np.packbits(np.asarray(individuals, dtype=np.uint8), axis=1)
+
+def unpack_individuals(population, num_items):
+    return np.unpackbits(population, axis=1, count=num_items)
+
+def create_initial_population(rng, population_size, num_items):
+    population = rng.integers(0, 256, size=(population_size, packed_length(num_items)), dtype=np.uint8)
+    population[:, -1] &= tail_mask(num_items)
+    return population
+
+def crossover_tails(cuts, num_items):
+    # One packed mask per cut point selecting the bits of items cut and above, i.e. the
+    # tail taken from the other parent: whole bytes after the cut byte, part of the cut byte
+    cut_bytes = cuts >> 3
+    tails = np.where(np.arange(packed_length(num_items)) > cut_bytes[:, None], np.uint8(0xFF), np.uint8(0))
+    tails[np.arange(len(cuts)), cut_bytes] = 0xFF >> (cuts & 7)
+    tails[:, -1] &= tail_mask(num_items)
+    return tails
+
+def item_arrays(items):
+    weights = np.array([item[0] for item in items])
+    values = np.array([item[1] for item in items])
+    return weights, values
+
+# Items per chunk of rows for evaluation and mutation, so neither ever unpacks the whole
+# population. Evaluation also widens the unpacked bits to the item arrays' dtype (8 bytes each).
+CHUNK_BITS = 1 << 20
+
+def chunk_rows(num_rows, num_items):
+    rows_per_chunk = max(1, CHUNK_BITS // max(num_items, 1))
+    return [slice(start, start + rows_per_chunk) for start in range(0, num_rows, rows_per_chunk)]
+
+def score_genes(genes, weights, values, capacity):
+    total_values = genes @ values
+    if (weights >= 0).all():
+        overweight = genes @ weights > capacity
+    else:
+        # With negative weights the scalar rule (stop as soon as the running weight
+        # exceeds the capacity) depends on item order, so check every included prefix
+        running_weights = np.cumsum(genes * weights, axis=1)
+        overweight = ((running_weights > capacity) & (genes == 1)).any(axis=1)
+    return np.where(overweight, 0, total_values)
+
+def evaluate_fitness_batch(genes, weights, values, capacity):
+    # Scores a (population_size x num_items) 0/1 matrix, zero for any overweight individual
+    genes = np.asarray(genes, dtype=np.uint8).reshape(-1, len(values))
+    fitness = np.empty(len(genes), dtype=np.result_type(genes, values))
+    for rows in chunk_rows(len(genes), len(values)):
+        fitness[rows] = score_genes(genes[rows], weights, values, capacity)
+    return fitness
+
+def evaluate_population(population, weights, values, capacity, num_items):
+    fitness = np.empty(len(population), dtype=np.result_type(np.uint8, values))
+    for rows in chunk_rows(len(population), num_items):
+        fitness[rows] = score_genes(unpack_individuals(population[rows], num_items), weights, values, capacity)
+    return fitness
+
+def tournament_selection(rng, fitness, num_selections, tournament_size=5):
+    return tournament_indices(rng, fitness, num_selections, tournament_size, maximize=True)
+
+def single_point_crossover(rng, parents1, parents2, num_items):
+    if num_items < 2:
+        return parents1.copy(), parents2.copy()
+    tails = crossover_tails(rng.integers(1, num_items, size=len(parents1)), num_items)
+    child1 = (parents1 & ~tails) | (parents2 & tails)
+    child2 = (parents2 & ~tails) | (parents1 & tails)
+    return child1, child2
+
+def distinct_positions(rng, num_positions, count):
+    # count distinct positions in range(num_positions), uniformly at random, without
+    # building the whole range the way rng.choice(..., replace=False) does
+    positions = np.empty(0, dtype=np.int64)
+    while len(positions) < count:
+        positions = np.concatenate([positions, rng.integers(0, num_positions, size=count - len(positions))])
+        positions.sort()
+        positions = positions[np.r_[True, positions[1:] != positions[:-1]]]
+    return positions
+
+def mutation(rng, population, mutation_rate, num_items):
+    # Flip each bit independently with probability mutation_rate. The flipped positions
+    # are drawn and packed into a xor mask one chunk of rows at a time.
+    for rows in chunk_rows(len(population), num_items):
+        chunk = population[rows]
+        total_bits = len(chunk) * num_items
+        num_flips = rng.binomial(total_bits, mutation_rate)
+        if num_flips == 0:
+            continue
+        flips = np.zeros(total_bits, dtype=np.uint8)
+        flips[distinct_positions(rng, total_bits, num_flips)] = 1
+        chunk ^= np.packbits(flips.reshape(len(chunk), num_items), axis=1)
+    return population
+
+def evolve_generation(rng, population, fitness, mutation_rate, num_items, tournament_size=5):
+    population_size = len(population)
+    selected_individuals = population[tournament_selection(rng, fitness, population_size, tournament_size)]
+
+    # Two distinct parents per pair, two children per pair
+    num_pairs = (population_size + 1) // 2
+    first = rng.integers(0, population_size, size=num_pairs)
+    if population_size > 1:
+        second = (first + rng.integers(1, population_size, size=num_pairs)) % population_size
+    else:
+        second = first
+    child1, child2 = single_point_crossover(rng, selected_individuals[first], selected_individuals[second], num_items)
+
+    new_population = np.concatenate([child1, child2])[:population_size]
+    return mutation(rng, new_population, mutation_rate, num_items)
+
+def genetic_algorithm(items, capacity, population_size, num_generations, mutation_rate, seed=None, evaluator=None,
+                      tournament_size=5):
+    rng = np.random.default_rng(seed)
+    num_items = len(items)
+    weights, values = item_arrays(items)
+
+    if evaluator is None:
+        evaluator = Evaluator("serial")
+    evaluate = partial(evaluator.evaluate_batch, partial(evaluate_population, weights=weights, values=values,
+                                                          capacity=capacity, num_items=num_items))
+
+    population = create_initial_population(rng, population_size, num_items)
+    fitness = evaluate(population)
+
+    best_fitness_values = []
+    generations = list(range(num_generations + 1))
+
+    for generation in range(num_generations + 1):
+        population = evolve_generation(rng, population, fitness, mutation_rate, num_items, tournament_size)
+        fitness = evaluate(population)
+
+        best_index = np.argmax(fitness)
+        best_fitness_values.append(fitness[best_index].item())
+
+    best_individual = unpack_individuals(population[best_index:best_index + 1], num_items)[0].tolist()
+    return generations, best_fitness_values, best_individual, fitness[best_index].item()
@@ -0,0 +1,78 @@
+import random
+from functools import partial
+
+import knapsack_engine
+from evaluators import Evaluator
+from selection import tournament_selection
+
+# Pure-Python (list-based) knapsack GA, one 0/1 list per individual. The bit-packed
+# counterpart is knapsack_engine.py. Every helper takes the random.Random it draws from.
+
+def create_individual(num_items, rng=random):
+    return [rng.randint(0, 1) for _ in range(num_items)]
+
+def create_initial_population(population_size, num_items, rng=random):
+    return [create_individual(num_items, rng) for _ in range(population_size)]
+
+def single_point_crossover(parent1, parent2, rng=random):
+    if len(parent1) < 2:
+        return parent1[:], parent2[:]
+    crossover_point = rng.randint(1, len(parent1) - 1)
+    child1 = parent1[:crossover_point] + parent2[crossover_point:]
+    child2 = parent2[:crossover_point] + parent1[crossover_point:]
+    return child1, child2
+
+def mutation(individual, mutation_rate, rng=random):
+    for i in range(len(individual)):
+        if rng.random() < mutation_rate:
+            individual[i] = 1 - individual[i]  # Flip the bit
+    return individual
+
+def genetic_algorithm(items, capacity, population_size, num_generations, mutation_rate, seed=None, evaluator=None,
+                      tournament_size=5, cancel_event=None):
+    # Returns None if cancel_event is set before the run finishes
+    rng = random.Random(seed)
+    if evaluator is None:
+        evaluator = Evaluator("serial")
+    weights, values = knapsack_engine.item_arrays(items)
+    evaluate = partial(evaluator.evaluate_batch, partial(knapsack_engine.evaluate_fitness_batch,
+                                                          weights=weights, values=values, capacity=capacity))
+
+    num_items = len(items)
+    population = create_initial_population(population_size, num_items, rng)
+    fitness_values = evaluate(population).tolist()
+
+    best_fitness_values = []
+    generations = list(range(num_generations + 1))
+
+    for generation in range(num_generations + 1):
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+
+        selected_individuals = tournament_selection(population, fitness_values, num_selections=population_size,
+                                                    tournament_size=tournament_size, maximize=True, rng=rng)
+        new_population = []
+
+        while len(new_population) < population_size:
+            if population_size > 1:
+                parent1, parent2 = rng.sample(selected_individuals, 2)
+            else:
+                # A population of one can only pair its single parent with itself
+                parent1 = parent2 = selected_individuals[0]
+            child1, child2 = single_point_crossover(parent1, parent2, rng)
+
+            child1 = mutation(child1, mutation_rate, rng)
+            child2 = mutation(child2, mutation_rate, rng)
+
+            new_population.append(child1)
+            new_population.append(child2)
+
+        population = new_population
+        fitness_values = evaluate(population).tolist()
+
+        best_index = max(range(len(population)), key=fitness_values.__getitem__)
+        best_individual = population[best_index]
+        best_fitness = fitness_values[best_index]
+        best_fitness_values.append(best_fitness)
+
+    return generations, best_fitness_values, best_individual, best_fitness
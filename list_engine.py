@@ -0,0 +1,138 @@
+import random
+
+import population_engine
+from convergence import MAX_GENERATIONS
+from selection import tournament_selection
+
+# Pure-Python (list-based) engine for the real-valued/binary GA, one list per individual.
+# It mirrors population_engine.py operator for operator and is kept as the plain
+# reference implementation. Every helper takes the random.Random it draws from.
+
+def create_binary_individual(individual_length, rng=random):
+    return [rng.choice([0, 1]) for _ in range(individual_length)]
+
+def create_real_valued_individual(bounds, rng=random):
+    return [rng.uniform(bounds[i][0], bounds[i][1]) for i in range(len(bounds))]
+
+def create_initial_population(population_size, encoding_scheme, individual_length=None, bounds=None, rng=random):
+    if encoding_scheme == "Binary":
+        return [create_binary_individual(individual_length, rng) for _ in range(population_size)]
+    elif encoding_scheme == "Real-Valued":
+        return [create_real_valued_individual(bounds, rng) for _ in range(population_size)]
+    else:
+        return []
+
+def single_point_crossover(parent1, parent2, rng=random):
+    if len(parent1) < 2:
+        return parent1[:]
+    crossover_point = rng.randint(1, len(parent1) - 1)
+    child = parent1[:crossover_point] + parent2[crossover_point:]
+    return child
+
+def multi_point_crossover(parent1, parent2, rng=random):
+    if len(parent1) < 2:
+        return parent1[:]
+    num_crossover_points = rng.randint(1, len(parent1) - 1)
+    # The genome length closes the last segment
+    crossover_points = sorted(rng.sample(range(1, len(parent1)), num_crossover_points)) + [len(parent1)]
+    child = parent1[:crossover_points[0]]
+    for i in range(num_crossover_points):
+        # Parents alternate at every cut, parent2 first (as in population_engine.multi_point_crossover)
+        parent = parent2 if i % 2 == 0 else parent1
+        child += parent[crossover_points[i]:crossover_points[i + 1]]
+    return child
+
+def bit_flip_mutation(individual, rng=random):
+    mutation_point = rng.randint(0, len(individual) - 1)
+    individual[mutation_point] = 1 - individual[mutation_point]
+    return individual
+
+def random_value_change_mutation(individual, bounds, rng=random):
+    mutation_point = rng.randint(0, len(individual) - 1)
+    if bounds is None:
+        individual[mutation_point] = rng.randint(0, 1)  # Binary genomes: a random bit
+    else:
+        individual[mutation_point] = rng.uniform(bounds[mutation_point][0], bounds[mutation_point][1])
+    return individual
+
+def genetic_algorithm(population_size, num_generations, encoding_scheme, selected_function, crossover_rate, mutation_rate,
+                      crossover_operator="Single-Point", mutation_operator="Bit Flip", elitism=False, bounds=None, seed=None,
+                      evaluator=None, progress_callback=None, stopping_criteria=None, tournament_size=5,
+                      bits_per_variable=16, migration=None):
+    # bounds holds one (lower, upper) pair per variable; binary genomes use bits_per_variable bits per variable
+    rng = random.Random(seed)
+    if stopping_criteria is not None:
+        stopping_criteria.start()
+
+    # The objective scores the whole population in one call; it is looked up once, not per individual
+    problem = population_engine.prepare_problem(encoding_scheme, selected_function, bounds, bits_per_variable, evaluator)
+    if problem is None:
+        return [], [], [], None
+    objective, individual_length, gene_bounds, evaluator = problem
+    population = create_initial_population(population_size, encoding_scheme, individual_length, bounds, rng)
+    fitness_values = evaluator.evaluate_batch(objective, population).tolist()
+    evaluations = population_size
+    stop_reason = MAX_GENERATIONS
+
+    best_fitness_values = []
+    best_individuals = []
+
+    for generation in range(num_generations + 1):
+        selected_individuals = tournament_selection(population, fitness_values, num_selections=population_size,
+                                                    tournament_size=tournament_size, rng=rng)
+        new_population = []
+
+        while len(new_population) < population_size:
+            if population_size > 1:
+                parent1, parent2 = rng.sample(selected_individuals, 2)
+            else:
+                # A population of one can only pair its single parent with itself
+                parent1 = parent2 = selected_individuals[0]
+
+            if rng.random() < crossover_rate:
+                if crossover_operator == "Single-Point":
+                    child = single_point_crossover(parent1, parent2, rng)
+                elif crossover_operator == "Multi-Point":
+                    child = multi_point_crossover(parent1, parent2, rng)
+            else:
+                child = parent1[:]  # No crossover, copy one of the parents as the child
+
+            if rng.random() < mutation_rate:
+                if mutation_operator == "Bit Flip":
+                    child = bit_flip_mutation(child, rng)
+                elif mutation_operator == "Random Value Change":
+                    child = random_value_change_mutation(child, gene_bounds, rng)
+
+            new_population.append(child)
+
+        if elitism:
+            # Preserve the best individual from the previous generation
+            elitism_individual = population[min(range(len(population)), key=fitness_values.__getitem__)]
+            new_population[rng.randint(0, population_size - 1)] = elitism_individual
+
+        population = new_population
+        fitness_values = evaluator.evaluate_batch(objective, population).tolist()
+        evaluations += population_size
+
+        if migration is not None:
+            # Island model: may swap individuals (and their fitness) in place, see islands.py
+            migration(generation, population, fitness_values)
+
+        best_index = min(range(len(population)), key=fitness_values.__getitem__)
+        if encoding_scheme == "Binary":
+            best_individuals.append(population_engine.decode_binary([population[best_index]], bounds, bits_per_variable)[0].tolist())
+        else:
+            best_individuals.append(population[best_index])
+        best_fitness_values.append(fitness_values[best_index])
+
+        if progress_callback is not None:
+            progress_callback(generation, best_fitness_values[-1], best_individuals[-1])
+
+        if stopping_criteria is not None:
+            reason = stopping_criteria.update(best_fitness_values[-1], evaluations)
+            if reason is not None:
+                stop_reason = reason
+                break
+
+    generations = list(range(len(best_fitness_values)))
+    return generations, best_fitness_values, best_individuals, stop_reason
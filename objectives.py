@@ -0,0 +1,60 @@
+import numpy as np
+
+# Vectorized benchmark objectives (all minimized). Each one scores an (n x d) array of
+# individuals, one per row, and returns the n fitness values. Look an objective up with
+# resolve_objective() once per run rather than dispatching on its name per evaluation.
+
+def as_batch(population):
+    population = np.asarray(population, dtype=float)
+    if population.ndim == 1:
+        population = population[:, None]
+    return population
+
+def sphere(population):
+    x = as_batch(population)
+    return np.sum(x**2, axis=1)
+
+def rosenbrock(population):
+    x = as_batch(population)
+    return np.sum(100 * (x[:, 1:] - x[:, :-1]**2)**2 + (1 - x[:, :-1])**2, axis=1)
+
+def ackley(population):
+    x = as_batch(population)
+    return (-20 * np.exp(-0.2 * np.sqrt(np.mean(x**2, axis=1)))
+            - np.exp(np.mean(np.cos(2 * np.pi * x), axis=1)) + np.e + 20)
+
+def rastrigin(population):
+    x = as_batch(population)
+    return 10 * x.shape[1] + np.sum(x**2 - 10 * np.cos(2 * np.pi * x), axis=1)
+
+def beale(population):
+    x = as_batch(population)
+    x, y = x[:, 0], x[:, 1]
+    return (1.5 - x + x * y)**2 + (2.25 - x + x * y**2)**2 + (2.625 - x + x * y**3)**2
+
+# name: (function, smallest dimension, largest dimension or None for unbounded)
+OBJECTIVES = {
+    "Sphere Function": (sphere, 1, None),
+    "Rosenbrock Function": (rosenbrock, 2, None),
+    "Ackley Function": (ackley, 1, None),
+    "Rastrigin Function": (rastrigin, 1, None),
+    "Beale Function": (beale, 2, 2),
+}
+
+def resolve_objective(name, dimension):
+    if callable(name):
+        # A batch objective passed in directly instead of by name, e.g. an async_evaluation.AsyncObjective
+        return name
+    try:
+        function, min_dimension, max_dimension = OBJECTIVES[name]
+    except KeyError:
+        raise ValueError(f"Unknown objective function: {name}") from None
+    if dimension < min_dimension or (max_dimension is not None and dimension > max_dimension):
+        if max_dimension == min_dimension:
+            expected = f"exactly {min_dimension}"
+        elif max_dimension is None:
+            expected = f"at least {min_dimension}"
+        else:
+            expected = f"{min_dimension} to {max_dimension}"
+        raise ValueError(f"{name} needs {expected} dimensions, got {dimension}")
+    return function
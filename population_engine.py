@@ -0,0 +1,338 @@
+from functools import partial
+
+import numpy as np
+
+from convergence import MAX_GENERATIONS
+from evaluators import Evaluator
+from objectives import resolve_objective
+from selection import tournament_indices
+
+# Vectorized population engine for the real-valued/binary GA in Genetic_9Param.py.
+# The whole population lives in one 2-D array (one row per individual) and every
+# operator works on all rows at once.
+
+def create_initial_population(rng, population_size, encoding_scheme, individual_length=None, bounds=None):
+    if encoding_scheme == "Binary":
+        return rng.integers(0, 2, size=(population_size, individual_length), dtype=np.int8)
+    elif encoding_scheme == "Real-Valued":
+        lower, upper = np.asarray(bounds, dtype=float).T
+        return rng.uniform(lower, upper, size=(population_size, len(bounds)))
+    else:
+        return None
+
+def tournament_selection(rng, fitness, num_selections, tournament_size=5):
+    # Winner is the lowest fitness of each tournament
+    return tournament_indices(rng, fitness, num_selections, tournament_size)
+
+def choose_parents(rng, num_selected, num_children):
+    # Two distinct parents per child, like random.sample(selected_individuals, 2)
+    first = rng.integers(0, num_selected, size=num_children)
+    if num_selected < 2:
+        return first, first
+    second = (first + rng.integers(1, num_selected, size=num_children)) % num_selected
+    return first, second
+
+def single_point_crossover(rng, parents1, parents2):
+    individual_length = parents1.shape[1]
+    if individual_length < 2:
+        return parents1.copy()
+    crossover_points = rng.integers(1, individual_length, size=(len(parents1), 1))
+    mask = np.arange(individual_length) >= crossover_points
+    return np.where(mask, parents2, parents1)
+
+def multi_point_crossover(rng, parents1, parents2):
+    individual_length = parents1.shape[1]
+    if individual_length < 2:
+        return parents1.copy()
+    # Pick a random number of distinct cut points per child, then alternate parents between cuts
+    num_crossover_points = rng.integers(1, individual_length, size=(len(parents1), 1))
+    ranks = rng.random((len(parents1), individual_length - 1)).argsort(axis=1).argsort(axis=1)
+    cuts = np.zeros(parents1.shape, dtype=bool)
+    cuts[:, 1:] = ranks < num_crossover_points
+    mask = np.cumsum(cuts, axis=1) % 2 == 1
+    return np.where(mask, parents2, parents1)
+
+def bit_flip_mutation(rng, population, rows):
+    mutation_points = rng.integers(0, population.shape[1], size=len(rows))
+    population[rows, mutation_points] = 1 - population[rows, mutation_points]
+    return population
+
+def random_value_change_mutation(rng, population, rows, bounds):
+    mutation_points = rng.integers(0, population.shape[1], size=len(rows))
+    if bounds is None:
+        # Binary genomes: the new value is a random bit
+        population[rows, mutation_points] = rng.integers(0, 2, size=len(rows))
+        return population
+    lower, upper = np.asarray(bounds, dtype=float).T
+    population[rows, mutation_points] = rng.uniform(lower[mutation_points], upper[mutation_points])
+    return population
+
+def binary_place_values(bits_per_variable):
+    return 2.0 ** np.arange(bits_per_variable - 1, -1, -1)
+
+def decode_binary(population, bounds, bits_per_variable):
+    # Each variable is a big-endian unsigned integer of bits_per_variable bits, mapped linearly
+    # onto its bounds, so bits_per_variable sets the precision: (upper - lower) / (2**bits - 1)
+    lower, upper = np.asarray(bounds, dtype=float).T
+    bits = np.asarray(population).reshape(len(population), len(bounds), bits_per_variable)
+    integers = bits @ binary_place_values(bits_per_variable)
+    return lower + integers * ((upper - lower) / (2.0**bits_per_variable - 1))
+
+def prepare_problem(encoding_scheme, selected_function, bounds, bits_per_variable, evaluator=None):
+    # Setup shared by the continuous engines (this one, list_engine and steady_state).
+    # Returns (objective, individual_length, gene_bounds, evaluator), or None for an
+    # unknown encoding. Binary genomes are decoded before the objective sees them and
+    # their mutation draws bits rather than values within per-gene bounds.
+    objective = resolve_objective(selected_function, len(bounds))
+    if encoding_scheme == "Binary":
+        objective = partial(evaluate_decoded, objective=objective, bounds=bounds, bits_per_variable=bits_per_variable)
+        individual_length = len(bounds) * bits_per_variable
+        gene_bounds = None
+    elif encoding_scheme == "Real-Valued":
+        individual_length = len(bounds)
+        gene_bounds = bounds
+    else:
+        return None
+
+    if evaluator is None:
+        evaluator = Evaluator("serial")
+    return objective, individual_length, gene_bounds, evaluator
+
+def evaluate_decoded(population, objective, bounds, bits_per_variable):
+    return objective(decode_binary(population, bounds, bits_per_variable))
+
+def evolve_generation(rng, population, fitness, crossover_rate, mutation_rate, crossover_operator, mutation_operator, bounds=None,
+                      tournament_size=5):
+    population_size = len(population)
+    selected_individuals = population[tournament_selection(rng, fitness, population_size, tournament_size)]
+
+    first, second = choose_parents(rng, population_size, population_size)
+    parents1 = selected_individuals[first]
+    parents2 = selected_individuals[second]
+
+    return breed_offspring(rng, parents1, parents2, crossover_rate, mutation_rate, crossover_operator, mutation_operator,
+                           bounds)
+
+def breed_offspring(rng, parents1, parents2, crossover_rate, mutation_rate, crossover_operator, mutation_operator,
+                    bounds=None):
+    # One child per pair of parent rows; shared with the steady-state engine
+    num_children = len(parents1)
+
+    # No crossover means the child is a copy of the first parent
+    offspring = parents1.copy()
+    crossover_rows = np.flatnonzero(rng.random(num_children) < crossover_rate)
+    if crossover_operator == "Single-Point":
+        offspring[crossover_rows] = single_point_crossover(rng, parents1[crossover_rows], parents2[crossover_rows])
+    elif crossover_operator == "Multi-Point":
+        offspring[crossover_rows] = multi_point_crossover(rng, parents1[crossover_rows], parents2[crossover_rows])
+
+    mutation_rows = np.flatnonzero(rng.random(num_children) < mutation_rate)
+    if mutation_operator == "Bit Flip":
+        bit_flip_mutation(rng, offspring, mutation_rows)
+    elif mutation_operator == "Random Value Change":
+        random_value_change_mutation(rng, offspring, mutation_rows, bounds)
+
+    return offspring
+
+class GenerationBuffers:
+    # Work arrays for evolve_generation_into, allocated once per run. `spare` is the
+    # population buffer the next generation is written into before the two are swapped.
+    def __init__(self, population_size, individual_length, dtype, tournament_size=5):
+        if tournament_size < 1:
+            raise ValueError("tournament_size must be at least 1")
+        n, length = population_size, individual_length
+        self.spare = np.empty((n, length), dtype=dtype)
+        self.parents2 = np.empty((n, length), dtype=dtype)
+        self.mask = np.empty((n, length), dtype=bool)
+        self.columns = np.arange(length)
+        self.row_starts = np.arange(n)
+
+        self.tournament_draws = np.empty((n, tournament_size))
+        self.candidates = np.empty((n, tournament_size), dtype=np.intp)
+        self.candidate_fitness = np.empty((n, tournament_size))
+        self.winners = np.empty(n, dtype=np.intp)
+        self.selected = np.empty(n, dtype=np.intp)
+
+        self.draws = np.empty(n)
+        self.indices = np.empty(n, dtype=np.intp)
+        self.offsets = np.empty(n, dtype=np.intp)
+        self.parent_indices = np.empty(n, dtype=np.intp)
+        self.points = np.empty((n, 1), dtype=np.intp)
+        self.skip = np.empty(n, dtype=bool)
+        self.values = np.empty((n, 1))
+        self.lower = np.empty((n, 1))
+        self.upper = np.empty((n, 1))
+
+        # Multi-point crossover: a random key per cut position, sorted in place to find each row's threshold
+        self.cut_keys = np.empty((n, max(length - 1, 0)))
+        self.sorted_keys = np.empty((n, max(length - 1, 0)))
+        self.thresholds = np.empty((n, 1))
+        self.cuts = np.empty((n, length), dtype=bool)
+
+def random_integers_into(rng, high, draws, out):
+    # Uniform integers in [0, high) written into out, through a reusable float buffer
+    rng.random(out=draws)
+    np.multiply(draws, high, out=draws)
+    np.copyto(out, draws, casting="unsafe")
+    return out
+
+def crossover_mask_into(rng, buffers, crossover_rate, crossover_operator):
+    # Per-gene mask of where a child takes the second parent; rows that skip crossover stay all False
+    n, length = buffers.mask.shape
+    rng.random(out=buffers.draws)
+    np.greater_equal(buffers.draws, crossover_rate, out=buffers.skip)
+    if length < 2 or crossover_operator not in ("Single-Point", "Multi-Point"):
+        buffers.mask.fill(False)
+        return buffers.mask
+
+    points = buffers.points[:, 0]
+    random_integers_into(rng, length - 1, buffers.draws, points)
+    if crossover_operator == "Single-Point":
+        points += 1
+        np.copyto(points, length, where=buffers.skip)
+        np.greater_equal(buffers.columns, buffers.points, out=buffers.mask)
+        return buffers.mask
+
+    # Multi-Point: cut at the (points + 1) smallest keys of each row, then alternate parents between cuts
+    rng.random(out=buffers.cut_keys)
+    np.copyto(buffers.sorted_keys, buffers.cut_keys)
+    buffers.sorted_keys.sort(axis=1)
+    np.multiply(buffers.row_starts, length - 1, out=buffers.indices)
+    buffers.indices += points
+    np.take(buffers.sorted_keys.ravel(), buffers.indices, out=buffers.thresholds[:, 0], mode="clip")
+    np.copyto(buffers.thresholds[:, 0], -1.0, where=buffers.skip)
+    buffers.cuts[:, 0] = False
+    np.less_equal(buffers.cut_keys, buffers.thresholds, out=buffers.cuts[:, 1:])
+    # Running parity of the cuts, i.e. np.cumsum(cuts) % 2 without an integer temporary
+    np.logical_xor.accumulate(buffers.cuts, axis=1, out=buffers.mask)
+    return buffers.mask
+
+def mutate_into(rng, population, buffers, mutation_rate, mutation_operator, bounds=None):
+    # One gene per mutating row; rows that skip mutation get an out-of-range point and an all-False mask
+    n, length = population.shape
+    rng.random(out=buffers.draws)
+    np.greater_equal(buffers.draws, mutation_rate, out=buffers.skip)
+    points = buffers.points[:, 0]
+    random_integers_into(rng, length, buffers.draws, points)
+    np.copyto(points, length, where=buffers.skip)
+    np.equal(buffers.columns, buffers.points, out=buffers.mask)
+
+    if mutation_operator == "Bit Flip":
+        np.subtract(1, population, out=population, where=buffers.mask)
+    elif mutation_operator == "Random Value Change" and bounds is None:
+        # Binary genomes: the new value is a random bit
+        rng.random(out=buffers.values[:, 0])
+        np.multiply(buffers.values, 2, out=buffers.values)
+        np.copyto(population, buffers.values, where=buffers.mask, casting="unsafe")
+    elif mutation_operator == "Random Value Change":
+        lower, upper = np.asarray(bounds, dtype=float).T
+        np.take(lower, points, out=buffers.lower[:, 0], mode="clip")
+        np.take(upper, points, out=buffers.upper[:, 0], mode="clip")
+        rng.random(out=buffers.values[:, 0])
+        np.subtract(buffers.upper, buffers.lower, out=buffers.upper)
+        np.multiply(buffers.values, buffers.upper, out=buffers.values)
+        np.add(buffers.values, buffers.lower, out=buffers.values)
+        np.copyto(population, buffers.values, where=buffers.mask)
+    return population
+
+def evolve_generation_into(rng, population, fitness, buffers, crossover_rate, mutation_rate, crossover_operator,
+                           mutation_operator, bounds=None):
+    # Same operators as evolve_generation, but every intermediate lives in buffers and the
+    # children are written straight into buffers.spare. The indices are always in range, and
+    # np.take only writes into out unbuffered when mode is not "raise", hence mode="clip".
+    n = len(population)
+    tournament_size = buffers.candidates.shape[1]
+
+    # Tournament selection: flat index of each row's winner inside the candidate matrix
+    random_integers_into(rng, n, buffers.tournament_draws, buffers.candidates)
+    np.take(fitness, buffers.candidates, out=buffers.candidate_fitness, mode="clip")
+    np.argmin(buffers.candidate_fitness, axis=1, out=buffers.winners)
+    np.multiply(buffers.row_starts, tournament_size, out=buffers.indices)
+    buffers.indices += buffers.winners
+    np.take(buffers.candidates.ravel(), buffers.indices, out=buffers.selected, mode="clip")
+
+    # Two distinct parents per child; children start as copies of the first parent
+    random_integers_into(rng, n, buffers.draws, buffers.indices)
+    np.take(buffers.selected, buffers.indices, out=buffers.parent_indices, mode="clip")
+    np.take(population, buffers.parent_indices, axis=0, out=buffers.spare, mode="clip")
+    if n > 1:
+        random_integers_into(rng, n - 1, buffers.draws, buffers.offsets)
+        buffers.offsets += 1
+        buffers.indices += buffers.offsets
+        np.remainder(buffers.indices, n, out=buffers.indices)
+    np.take(buffers.selected, buffers.indices, out=buffers.parent_indices, mode="clip")
+    np.take(population, buffers.parent_indices, axis=0, out=buffers.parents2, mode="clip")
+
+    mask = crossover_mask_into(rng, buffers, crossover_rate, crossover_operator)
+    np.copyto(buffers.spare, buffers.parents2, where=mask)
+    return mutate_into(rng, buffers.spare, buffers, mutation_rate, mutation_operator, bounds)
+
+def genetic_algorithm(population_size, num_generations, encoding_scheme, selected_function, crossover_rate, mutation_rate,
+                      crossover_operator="Single-Point", mutation_operator="Bit Flip", elitism=False, bounds=None, seed=None,
+                      evaluator=None, progress_callback=None, stopping_criteria=None, double_buffered=False,
+                      tournament_size=5, bits_per_variable=16, migration=None):
+    # bounds holds one (lower, upper) pair per variable, for either encoding. Binary genomes
+    # spend bits_per_variable bits on each variable and are decoded before evaluation.
+    # double_buffered reuses two preallocated population buffers instead of building new arrays every generation
+    rng = np.random.default_rng(seed)
+    if stopping_criteria is not None:
+        stopping_criteria.start()
+
+    problem = prepare_problem(encoding_scheme, selected_function, bounds, bits_per_variable, evaluator)
+    if problem is None:
+        return [], [], [], None
+    objective, individual_length, gene_bounds, evaluator = problem
+    population = create_initial_population(rng, population_size, encoding_scheme, individual_length, bounds)
+    evaluate = partial(evaluator.evaluate_batch, objective)
+
+    if double_buffered:
+        buffers = GenerationBuffers(population_size, population.shape[1], population.dtype, tournament_size)
+
+    fitness = evaluate(population)
+    evaluations = population_size
+    stop_reason = MAX_GENERATIONS
+
+    best_fitness_values = []
+    best_individuals = []
+
+    for generation in range(num_generations + 1):
+        if double_buffered:
+            new_population = evolve_generation_into(rng, population, fitness, buffers, crossover_rate, mutation_rate,
+                                                    crossover_operator, mutation_operator, gene_bounds)
+        else:
+            new_population = evolve_generation(rng, population, fitness, crossover_rate, mutation_rate,
+                                               crossover_operator, mutation_operator, gene_bounds, tournament_size)
+
+        if elitism:
+            # Preserve the best individual from the previous generation
+            new_population[rng.integers(0, population_size)] = population[np.argmin(fitness)]
+
+        if double_buffered:
+            # The old population becomes the buffer the next generation is written into
+            buffers.spare = population
+        population = new_population
+        fitness = evaluate(population)
+        evaluations += population_size
+
+        if migration is not None:
+            # Island model: may swap individuals (and their fitness) in place, see islands.py
+            migration(generation, population, fitness)
+
+        best_index = np.argmin(fitness)
+        best_individual = population[best_index:best_index + 1]
+        if encoding_scheme == "Binary":
+            best_individual = decode_binary(best_individual, bounds, bits_per_variable)
+        best_individuals.append(best_individual[0].tolist())
+        best_fitness_values.append(float(fitness[best_index]))
+
+        if progress_callback is not None:
+            progress_callback(generation, best_fitness_values[-1], best_individuals[-1])
+
+        if stopping_criteria is not None:
+            reason = stopping_criteria.update(best_fitness_values[-1], evaluations)
+            if reason is not None:
+                stop_reason = reason
+                break
+
+    generations = list(range(len(best_fitness_values)))
+    return generations, best_fitness_values, best_individuals, stop_reason
@@ -0,0 +1,110 @@
+import random
+from math import sqrt
+
+from selection import numpy_generator, selection_strategy
+
+# GA for the one-variable quadratic x**2 + 5*x + 6 on [-10, 10], used by the Flask app
+# and untitled2.py. Every helper takes the random.Random it draws from.
+
+LOWER_BOUND, UPPER_BOUND = -10, 10
+
+def create_individual(rng=random):
+    return rng.uniform(LOWER_BOUND, UPPER_BOUND)
+
+def create_initial_population(population_size, rng=random):
+    return [create_individual(rng) for _ in range(population_size)]
+
+def evaluate_fitness(individual):
+    x = individual
+    return x**2 + 5*x + 6
+
+def clip_to_bounds(x):
+    return min(max(x, LOWER_BOUND), UPPER_BOUND)
+
+def blend_crossover(parent1, parent2, rng=random, alpha=0.5):
+    # BLX-alpha: uniform over the parents' interval widened by alpha times its length on both sides,
+    # so children can land outside the parents and the population does not just shrink to its mean
+    low, high = min(parent1, parent2), max(parent1, parent2)
+    spread = alpha * (high - low)
+    return clip_to_bounds(rng.uniform(low - spread, high + spread))
+
+def arithmetic_crossover(parent1, parent2, rng=random):
+    # Random convex combination of the parents
+    weight = rng.random()
+    return weight * parent1 + (1 - weight) * parent2
+
+CROSSOVER_OPERATORS = {
+    'blx': blend_crossover,
+    'arithmetic': arithmetic_crossover,
+}
+
+def gaussian_mutation(individual, rng=random, scale=0.1):
+    # Step with a standard deviation of scale times the search range, clipped back into the bounds
+    return clip_to_bounds(individual + rng.gauss(0, scale * (UPPER_BOUND - LOWER_BOUND)))
+
+def generation_statistics(generation, population, fitness_values):
+    mean_fitness = sum(fitness_values) / len(fitness_values)
+    mean_individual = sum(population) / len(population)
+    diversity = sqrt(sum((individual - mean_individual)**2 for individual in population) / len(population))
+    return {
+        'generation': generation,
+        'best_fitness': min(fitness_values),
+        'mean_fitness': mean_fitness,
+        'diversity': diversity,
+    }
+
+def evolve(population_size, num_generations, mutation_rate, crossover_rate, selection_method, elitism, seed=None,
+           tournament_size=5, crossover_operator='blx'):
+    # Yields the statistics of each generation as soon as it has been evaluated
+    rng = random.Random(seed)
+    select = selection_strategy(selection_method, tournament_size)
+    crossover = CROSSOVER_OPERATORS[crossover_operator]
+    selection_rng = numpy_generator(rng)
+    population = create_initial_population(population_size, rng)
+    fitness_values = [evaluate_fitness(individual) for individual in population]
+
+    for generation in range(num_generations + 1):
+        selected_indices = select(selection_rng, fitness_values, population_size)
+        selected_individuals = [population[i] for i in selected_indices.tolist()]
+        new_population = []
+
+        while len(new_population) < population_size:
+            if population_size > 1:
+                parent1, parent2 = rng.sample(selected_individuals, 2)
+            else:
+                # A population of one can only pair its single parent with itself
+                parent1 = parent2 = selected_individuals[0]
+
+            if rng.random() < crossover_rate:
+                child = crossover(parent1, parent2, rng)
+            else:
+                child = parent1  # No crossover, copy one of the parents as the child
+
+            if rng.random() < mutation_rate:
+                child = gaussian_mutation(child, rng)
+
+            new_population.append(child)
+
+        if elitism:
+            # Preserve the best individual from the previous generation
+            elitism_individual = population[min(range(len(population)), key=fitness_values.__getitem__)]
+            new_population[rng.randrange(population_size)] = elitism_individual
+
+        population = new_population
+        fitness_values = [evaluate_fitness(individual) for individual in population]
+
+        yield generation_statistics(generation, population, fitness_values)
+
+def genetic_algorithm(population_size, num_generations, mutation_rate, crossover_rate, selection_method, elitism, seed=None,
+                      tournament_size=5, crossover_operator='blx', progress_callback=None):
+    best_fitness_values = []
+    generations = list(range(num_generations + 1))
+
+    for statistics in evolve(population_size, num_generations, mutation_rate, crossover_rate, selection_method, elitism, seed,
+                             tournament_size, crossover_operator):
+        best_fitness_values.append(statistics['best_fitness'])
+
+        if progress_callback is not None:
+            progress_callback(statistics['generation'], statistics['best_fitness'])
+
+    return generations, best_fitness_values
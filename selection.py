@@ -0,0 +1,92 @@
+import random
+from functools import partial
+
+import numpy as np
+
+# Batched selection shared by the list-based GAs and the NumPy engines. Every strategy
+# takes (rng, fitness, num_selections, maximize=False), draws all the picks of a
+# generation at once and returns indices into the population.
+#
+# Tournament draws a (num_selections x tournament_size) matrix of candidate indices and
+# looks each row's winner up in a precomputed fitness array. Candidates are drawn with
+# replacement, so any population size works.
+
+def tournament_indices(rng, fitness, num_selections, tournament_size=5, maximize=False):
+    if tournament_size < 1:
+        raise ValueError("tournament_size must be at least 1")
+    fitness = np.asarray(fitness)
+    candidates = rng.integers(0, len(fitness), size=(num_selections, tournament_size))
+    candidate_fitness = fitness[candidates]
+    if maximize:
+        winners = np.argmax(candidate_fitness, axis=1)
+    else:
+        winners = np.argmin(candidate_fitness, axis=1)
+    return candidates[np.arange(num_selections), winners]
+
+def selection_weights(fitness, maximize=False):
+    # Fitness-proportional weights for a minimized or maximized objective, shifted so the
+    # worst individual gets zero; a flat population falls back to uniform weights
+    fitness = np.asarray(fitness, dtype=float)
+    if maximize:
+        weights = fitness - fitness.min()
+    else:
+        weights = fitness.max() - fitness
+    if not weights.any():
+        return np.ones(len(fitness))
+    return weights
+
+def sample_cumulative(cumulative_weights, points):
+    # Binary search of each point in [0, total) into the running sum of the weights
+    indices = np.searchsorted(cumulative_weights, points, side="right")
+    return np.minimum(indices, len(cumulative_weights) - 1)
+
+def roulette_indices(rng, fitness, num_selections, maximize=False):
+    cumulative_weights = np.cumsum(selection_weights(fitness, maximize))
+    return sample_cumulative(cumulative_weights, rng.random(num_selections) * cumulative_weights[-1])
+
+def stochastic_universal_indices(rng, fitness, num_selections, maximize=False):
+    # One spin, num_selections evenly spaced pointers: same expectation as roulette, less spread.
+    # The picks come out sorted, so they are shuffled before callers pair them up.
+    cumulative_weights = np.cumsum(selection_weights(fitness, maximize))
+    spacing = cumulative_weights[-1] / num_selections
+    points = (rng.random() + np.arange(num_selections)) * spacing
+    return rng.permutation(sample_cumulative(cumulative_weights, points))
+
+def rank_indices(rng, fitness, num_selections, maximize=False):
+    # Linear ranking: the best of n individuals has weight n, the worst weight 1, whatever the fitness scale
+    order = np.argsort(fitness)
+    if maximize:
+        order = order[::-1]
+    population_size = len(order)
+    cumulative_weights = np.cumsum(np.arange(population_size, 0, -1))
+    ranks = sample_cumulative(cumulative_weights, rng.random(num_selections) * cumulative_weights[-1])
+    return order[ranks]
+
+SELECTION_METHODS = {
+    "tournament": tournament_indices,
+    "roulette": roulette_indices,
+    "sus": stochastic_universal_indices,
+    "rank": rank_indices,
+}
+
+def selection_strategy(selection_method, tournament_size=5):
+    # Resolved once per run; the returned function is called every generation
+    try:
+        strategy = SELECTION_METHODS[selection_method]
+    except KeyError:
+        raise ValueError(f"Unknown selection method {selection_method!r}, "
+                         f"expected one of {', '.join(SELECTION_METHODS)}") from None
+    if strategy is tournament_indices:
+        if tournament_size < 1:
+            raise ValueError("tournament_size must be at least 1")
+        return partial(tournament_indices, tournament_size=tournament_size)
+    return strategy
+
+def numpy_generator(rng=random):
+    # Seeded from the caller's random.Random (or the random module itself), so random.seed()
+    # and random.Random(seed) still make the list-based runs reproducible
+    return np.random.default_rng(rng.getrandbits(64))
+
+def tournament_selection(population, fitness_values, num_selections, tournament_size=5, maximize=False, rng=random):
+    indices = tournament_indices(numpy_generator(rng), fitness_values, num_selections, tournament_size, maximize)
+    return [population[i] for i in indices.tolist()]
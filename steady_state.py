@@ -0,0 +1,145 @@
+import heapq
+from collections import deque
+
+import numpy as np
+
+from convergence import MAX_GENERATIONS
+from population_engine import breed_offspring, create_initial_population, decode_binary, prepare_problem
+from selection import tournament_indices
+
+# Steady-state (incremental replacement) engine for the real-valued/binary GA. Instead
+# of replacing the whole population every generation, each step breeds a few offspring
+# from the current population and puts them in place of the worst individuals (or of
+# random ones). Offspring are scored through Evaluator.submit_batch, so with a thread or
+# process backend the next offspring are bred while earlier ones are still evaluated.
+#
+# One reported "generation" is population_size evaluations, which keeps the curves and
+# evaluation counts comparable with the generational engines.
+
+REPLACE_WORST = "worst"
+REPLACE_RANDOM = "random"
+
+class PopulationHeap:
+    # Best and worst slot lookups in O(log n). A min-heap and a max-heap of
+    # (fitness, slot, version) entries; replacing a slot bumps its version and the
+    # outdated entries are dropped when they reach the top.
+    def __init__(self, fitness):
+        self.fitness = fitness
+        self.rebuild()
+
+    def rebuild(self):
+        self.best_heap = [(value, slot, 0) for slot, value in enumerate(self.fitness.tolist())]
+        self.worst_heap = [(-value, slot, 0) for slot, value in enumerate(self.fitness.tolist())]
+        self.versions = [0] * len(self.fitness)
+        heapq.heapify(self.best_heap)
+        heapq.heapify(self.worst_heap)
+
+    def top(self, heap):
+        while heap[0][2] != self.versions[heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0][1]
+
+    def best(self):
+        return self.top(self.best_heap)
+
+    def worst(self):
+        return self.top(self.worst_heap)
+
+    def replace(self, slot, value):
+        self.fitness[slot] = value
+        self.versions[slot] += 1
+        heapq.heappush(self.best_heap, (value, slot, self.versions[slot]))
+        heapq.heappush(self.worst_heap, (-value, slot, self.versions[slot]))
+        # Outdated entries are only dropped from the top; compact once they dominate
+        if len(self.best_heap) > 4 * len(self.fitness):
+            self.rebuild()
+
+def breed(rng, population, fitness, num_offspring, crossover_rate, mutation_rate, crossover_operator, mutation_operator,
+          bounds=None, tournament_size=5):
+    parents = population[tournament_indices(rng, fitness, 2 * num_offspring, tournament_size)]
+    return breed_offspring(rng, parents[:num_offspring], parents[num_offspring:], crossover_rate, mutation_rate,
+                           crossover_operator, mutation_operator, bounds)
+
+def replacement_slot(rng, heap, replacement, elitism):
+    if replacement == REPLACE_WORST:
+        return heap.worst()
+    slot = int(rng.integers(0, len(heap.fitness)))
+    if elitism and slot == heap.best():
+        # Never overwrite the best individual
+        return heap.worst()
+    return slot
+
+def genetic_algorithm(population_size, num_generations, encoding_scheme, selected_function, crossover_rate, mutation_rate,
+                      crossover_operator="Single-Point", mutation_operator="Bit Flip", elitism=False, bounds=None, seed=None,
+                      evaluator=None, progress_callback=None, stopping_criteria=None, tournament_size=5,
+                      bits_per_variable=16, migration=None, offspring_per_step=2, replacement=REPLACE_WORST,
+                      max_pending=4):
+    # Same arguments and result as population_engine.genetic_algorithm, plus:
+    # offspring_per_step: individuals bred (and replaced) per step
+    # replacement: REPLACE_WORST or REPLACE_RANDOM; elitism only matters for the latter
+    # max_pending: offspring batches in evaluation at once. Results are consumed in the
+    # order they were bred, so a run is reproducible for a fixed max_pending whatever the backend.
+    if replacement not in (REPLACE_WORST, REPLACE_RANDOM):
+        raise ValueError(f"Unknown replacement: {replacement}")
+    if offspring_per_step < 1 or max_pending < 1:
+        raise ValueError("offspring_per_step and max_pending must be at least 1")
+    rng = np.random.default_rng(seed)
+    if stopping_criteria is not None:
+        stopping_criteria.start()
+
+    problem = prepare_problem(encoding_scheme, selected_function, bounds, bits_per_variable, evaluator)
+    if problem is None:
+        return [], [], [], None
+    objective, individual_length, gene_bounds, evaluator = problem
+    population = create_initial_population(rng, population_size, encoding_scheme, individual_length, bounds)
+    heap = PopulationHeap(np.array(evaluator.evaluate_batch(objective, population), dtype=float))
+    evaluations = population_size
+    stop_reason = MAX_GENERATIONS
+
+    best_fitness_values = []
+    best_individuals = []
+    pending = deque()
+
+    for generation in range(num_generations + 1):
+        target_evaluations = evaluations + population_size
+        while evaluations < target_evaluations:
+            # Keep the pipeline full; breeding uses the population as it stands now
+            while len(pending) < max_pending:
+                offspring = breed(rng, population, heap.fitness, offspring_per_step, crossover_rate, mutation_rate,
+                                  crossover_operator, mutation_operator, gene_bounds, tournament_size)
+                pending.append((offspring, evaluator.submit_batch(objective, offspring)))
+
+            offspring, future = pending.popleft()
+            for individual, value in zip(offspring, future.result()):
+                slot = replacement_slot(rng, heap, replacement, elitism)
+                population[slot] = individual
+                heap.replace(slot, value)
+            evaluations += len(offspring)
+
+        if migration is not None:
+            # Island model: may swap individuals in place, so the heaps are rebuilt after it
+            migration(generation, population, heap.fitness)
+            heap.rebuild()
+
+        best_index = heap.best()
+        best_individual = population[best_index:best_index + 1]
+        if encoding_scheme == "Binary":
+            best_individual = decode_binary(best_individual, bounds, bits_per_variable)
+        best_individuals.append(best_individual[0].tolist())
+        best_fitness_values.append(float(heap.fitness[best_index]))
+
+        if progress_callback is not None:
+            progress_callback(generation, best_fitness_values[-1], best_individuals[-1])
+
+        if stopping_criteria is not None:
+            reason = stopping_criteria.update(best_fitness_values[-1], evaluations)
+            if reason is not None:
+                stop_reason = reason
+                break
+
+    # Offspring still in flight are dropped
+    for offspring, future in pending:
+        future.cancel()
+
+    generations = list(range(len(best_fitness_values)))
+    return generations, best_fitness_values, best_individuals, stop_reason
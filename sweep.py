@@ -0,0 +1,33 @@
+import itertools
+
+import knapsack_engine
+from evaluators import process_pool
+from ga_core import derive_seeds
+
+# Parameter sweeps for the knapsack GA. Every configuration is an independent run of
+# the bit-packed engine, so the grid is spread over a process pool and only the
+# best fitness of each run comes back.
+
+def parameter_grid(population_sizes, mutation_rates, generation_counts):
+    return list(itertools.product(population_sizes, mutation_rates, generation_counts))
+
+def run_configuration(items, capacity, population_size, mutation_rate, num_generations, seed):
+    generations, best_fitness_values, best_individual, best_fitness = knapsack_engine.genetic_algorithm(
+        items, capacity, population_size, num_generations, mutation_rate, seed=seed)
+    return {
+        "population_size": population_size,
+        "mutation_rate": mutation_rate,
+        "num_generations": num_generations,
+        "seed": seed,
+        "best_fitness": best_fitness,
+    }
+
+def run_sweep(items, capacity, population_sizes, mutation_rates, generation_counts, workers=None, seed=None):
+    grid = parameter_grid(population_sizes, mutation_rates, generation_counts)
+
+    seeds = derive_seeds(seed, len(grid))
+
+    with process_pool(workers) as executor:
+        futures = [executor.submit(run_configuration, items, capacity, population_size, mutation_rate, num_generations, run_seed)
+                   for (population_size, mutation_rate, num_generations), run_seed in zip(grid, seeds)]
+        return [future.result() for future in futures]
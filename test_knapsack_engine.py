@@ -0,0 +1,50 @@
+import random
+
+import numpy as np
+
+import knapsack_engine
+
+# Regression check: the vectorized knapsack fitness must give exactly the values of the
+# original per-individual evaluate_fitness, kept here as the reference.
+
+def evaluate_fitness(individual, items, capacity):
+    total_value = 0
+    total_weight = 0
+
+    for i in range(len(individual)):
+        if individual[i] == 1:
+            total_value += items[i][1]
+            total_weight += items[i][0]
+            if total_weight > capacity:
+                return 0
+
+    return total_value
+
+def check_against_scalar(rng, min_weight, cases=1000):
+    for _ in range(cases):
+        num_items = rng.randint(1, 12)
+        items = [(rng.randint(min_weight, 10), rng.randint(0, 100)) for _ in range(num_items)]
+        capacity = rng.randint(-5, 30)
+        population = [[rng.randint(0, 1) for _ in range(num_items)] for _ in range(rng.randint(1, 8))]
+
+        weights, values = knapsack_engine.item_arrays(items)
+        batch = knapsack_engine.evaluate_fitness_batch(population, weights, values, capacity)
+        assert batch.tolist() == [evaluate_fitness(individual, items, capacity) for individual in population]
+
+def test_matches_scalar_fitness():
+    check_against_scalar(random.Random(0), min_weight=0)
+
+def test_matches_scalar_fitness_with_negative_weights():
+    # The scalar rule stops at the first overweight prefix, so a later negative weight does not rescue it
+    check_against_scalar(random.Random(1), min_weight=-10)
+    weights, values = knapsack_engine.item_arrays([(5, 10), (-5, 10)])
+    assert knapsack_engine.evaluate_fitness_batch(np.array([[1, 1]]), weights, values, 3).tolist() == [0]
+
+def test_packed_population_matches_scalar_fitness():
+    rng = random.Random(2)
+    items = [(rng.randint(1, 10), rng.randint(0, 100)) for _ in range(13)]
+    population = [[rng.randint(0, 1) for _ in range(13)] for _ in range(50)]
+    weights, values = knapsack_engine.item_arrays(items)
+    packed = knapsack_engine.pack_individuals(np.array(population, dtype=np.uint8))
+    fitness = knapsack_engine.evaluate_population(packed, weights, values, 25, 13)
+    assert fitness.tolist() == [evaluate_fitness(individual, items, 25) for individual in population]
@@ -0,0 +1,86 @@
+import numpy as np
+
+import population_engine
+
+# The double-buffered generation (evolve_generation_into) must draw from the same
+# distributions as the allocating one (breed_offspring), and leave alone every row
+# that skips crossover or mutation.
+
+NUM_ROWS = 20000
+LENGTH = 6
+
+def bred_mask(rng, crossover_rate, crossover_operator):
+    # Children of an all-zero and an all-one parent show where breed_offspring took the second parent
+    parents1 = np.zeros((NUM_ROWS, LENGTH), dtype=np.int8)
+    parents2 = np.ones((NUM_ROWS, LENGTH), dtype=np.int8)
+    offspring = population_engine.breed_offspring(rng, parents1, parents2, crossover_rate, 0.0, crossover_operator, None)
+    return offspring.astype(bool)
+
+def buffered_mask(rng, crossover_rate, crossover_operator):
+    buffers = population_engine.GenerationBuffers(NUM_ROWS, LENGTH, np.int8)
+    mask = population_engine.crossover_mask_into(rng, buffers, crossover_rate, crossover_operator)
+    assert not mask[:, 0].any()
+    return mask
+
+def cut_points(mask):
+    # Fraction of the rows cut at 0..LENGTH, LENGTH standing for rows without crossover
+    points = np.where(mask.any(axis=1), mask.argmax(axis=1), LENGTH)
+    return np.bincount(points, minlength=LENGTH + 1) / len(mask)
+
+def cut_counts(mask):
+    # Fraction of the rows switching parents 0..LENGTH - 1 times
+    switches = np.count_nonzero(mask[:, 1:] != mask[:, :-1], axis=1) + mask[:, 0]
+    return np.bincount(switches, minlength=LENGTH) / len(mask)
+
+def test_single_point_masks_match_breed_offspring():
+    mask = buffered_mask(np.random.default_rng(0), 0.7, "Single-Point")
+    # Everything from the cut point on comes from the second parent
+    assert (mask[:, :-1] <= mask[:, 1:]).all()
+
+    buffered = cut_points(mask)
+    allocated = cut_points(bred_mask(np.random.default_rng(1), 0.7, "Single-Point"))
+    assert buffered[0] == allocated[0] == 0
+    assert np.allclose(buffered[1:LENGTH], 0.7 / (LENGTH - 1), atol=0.015)
+    assert np.allclose(buffered, allocated, atol=0.015)
+
+def test_multi_point_masks_match_breed_offspring():
+    buffered = cut_counts(buffered_mask(np.random.default_rng(2), 0.7, "Multi-Point"))
+    allocated = cut_counts(bred_mask(np.random.default_rng(3), 0.7, "Multi-Point"))
+    assert np.isclose(buffered[0], 0.3, atol=0.015)
+    assert np.allclose(buffered[1:], 0.7 / (LENGTH - 1), atol=0.015)
+    assert np.allclose(buffered, allocated, atol=0.015)
+
+def test_mutation_leaves_other_rows_untouched():
+    rng = np.random.default_rng(4)
+    bounds = [(-1.0, 1.0), (10.0, 20.0), (0.0, 0.5)]
+    population = rng.uniform(*np.array(bounds).T, size=(NUM_ROWS, len(bounds)))
+    buffers = population_engine.GenerationBuffers(NUM_ROWS, len(bounds), population.dtype)
+    mutated = population_engine.mutate_into(rng, population.copy(), buffers, 0.25, "Random Value Change", bounds)
+
+    changed = mutated != population
+    assert changed.sum(axis=1).max() == 1
+    assert np.isclose(changed.any(axis=1).mean(), 0.25, atol=0.015)
+    lower, upper = np.array(bounds).T
+    assert ((mutated >= lower) & (mutated <= upper)).all()
+
+def test_generation_without_crossover_or_mutation_copies_winners():
+    rng = np.random.default_rng(5)
+    population = rng.integers(0, 2, size=(50, 8), dtype=np.int8)
+    original = population.copy()
+    fitness = rng.random(50)
+    buffers = population_engine.GenerationBuffers(50, 8, population.dtype)
+    children = population_engine.evolve_generation_into(rng, population, fitness, buffers, 0.0, 0.0, "Single-Point",
+                                                        "Bit Flip")
+
+    assert children is buffers.spare
+    assert (population == original).all()
+    # Every child is an unchanged selected parent
+    assert (children[:, None, :] == population[None, :, :]).all(axis=2).any(axis=1).all()
+
+def test_generation_of_one_individual():
+    rng = np.random.default_rng(6)
+    population = rng.uniform(-1, 1, size=(1, 3))
+    buffers = population_engine.GenerationBuffers(1, 3, population.dtype)
+    children = population_engine.evolve_generation_into(rng, population, np.zeros(1), buffers, 1.0, 0.0,
+                                                        "Multi-Point", "Bit Flip")
+    assert (children == population).all()
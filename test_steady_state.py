@@ -0,0 +1,45 @@
+import numpy as np
+
+import steady_state
+
+# PopulationHeap must always agree with a plain argmin/argmax of the fitness array,
+# whatever mix of replacements, in-place edits (migration) and rebuilds came before.
+
+def check_heap(heap):
+    # Ties resolve to the lowest slot, as argmin/argmax do
+    assert heap.best() == np.argmin(heap.fitness)
+    assert heap.worst() == np.argmax(heap.fitness)
+
+def test_best_and_worst_follow_replacements():
+    rng = np.random.default_rng(0)
+    for population_size in [1, 2, 7, 30]:
+        # Small integer fitness values, so ties are common
+        heap = steady_state.PopulationHeap(rng.integers(0, 10, size=population_size).astype(float))
+        check_heap(heap)
+        for _ in range(2000):
+            # Enough replacements to go through several compactions
+            slot = int(rng.integers(0, population_size))
+            heap.replace(slot, float(rng.integers(0, 10)))
+            assert len(heap.best_heap) <= 4 * population_size + 1
+            check_heap(heap)
+
+def test_best_and_worst_after_rebuild():
+    rng = np.random.default_rng(1)
+    heap = steady_state.PopulationHeap(rng.random(20))
+    for _ in range(200):
+        if rng.random() < 0.2:
+            # Migration writes into the fitness array directly, then rebuilds
+            slots = rng.integers(0, 20, size=3)
+            heap.fitness[slots] = rng.random(3) * 2 - 0.5
+            heap.rebuild()
+        else:
+            heap.replace(int(rng.integers(0, 20)), float(rng.random()))
+        check_heap(heap)
+
+def test_random_replacement_keeps_the_best_with_elitism():
+    rng = np.random.default_rng(2)
+    heap = steady_state.PopulationHeap(rng.random(5))
+    for _ in range(500):
+        slot = steady_state.replacement_slot(rng, heap, steady_state.REPLACE_RANDOM, elitism=True)
+        assert slot != heap.best()
+        heap.replace(slot, float(rng.random()))
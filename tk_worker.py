@@ -0,0 +1,93 @@
+import queue
+import threading
+
+# Runs GA work off the Tk main loop. Requests are debounced with root.after, a new
+# request cancels the run in flight through its threading.Event, and progress and
+# results (or the error a run failed with) are handed back to the Tk thread through a
+# queue that the Tk thread polls.
+
+class RunCancelled(Exception):
+    pass
+
+class BackgroundRunner:
+    def __init__(self, root, work, on_result, delay_ms=150, poll_ms=16, on_progress=None, on_error=None):
+        # work(*args, cancel_event=...) runs on a worker thread; on_result(result) runs on the Tk thread.
+        # With on_progress, work also gets report=..., and on_progress(items) receives every item
+        # reported since the previous poll, so the UI redraws at most once per poll.
+        # If work raises, on_error(error) runs on the Tk thread; without on_error the error is
+        # re-raised there, so Tk reports it.
+        self.root = root
+        self.work = work
+        self.on_result = on_result
+        self.on_progress = on_progress
+        self.on_error = on_error
+        self.delay_ms = delay_ms
+        self.poll_ms = poll_ms
+        self.results = queue.Queue()
+        self.pending_after_id = None
+        self.cancel_event = None
+        self.root.after(self.poll_ms, self.poll)
+
+    def request(self, *args):
+        # Only the last request of a burst (e.g. a slider drag) gets to start
+        if self.pending_after_id is not None:
+            self.root.after_cancel(self.pending_after_id)
+        self.pending_after_id = self.root.after(self.delay_ms, self.start, *args)
+
+    def start(self, *args):
+        self.pending_after_id = None
+        self.cancel()
+        cancel_event = threading.Event()
+        self.cancel_event = cancel_event
+        threading.Thread(target=self.run, args=(cancel_event, args), daemon=True).start()
+
+    def run(self, cancel_event, args):
+        def report(*item):
+            # Called from the GA loop; doubles as the cancellation point
+            if cancel_event.is_set():
+                raise RunCancelled()
+            self.results.put((cancel_event, "progress", item))
+
+        try:
+            if self.on_progress is None:
+                result = self.work(*args, cancel_event=cancel_event)
+            else:
+                result = self.work(*args, cancel_event=cancel_event, report=report)
+        except RunCancelled:
+            return
+        except Exception as error:
+            self.results.put((cancel_event, "error", error))
+            return
+        if not cancel_event.is_set():
+            self.results.put((cancel_event, "result", result))
+
+    def cancel(self):
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+
+    def poll(self):
+        progress_items = []
+        while True:
+            try:
+                cancel_event, kind, payload = self.results.get_nowait()
+            except queue.Empty:
+                break
+            # Drop anything from runs that have been superseded
+            if cancel_event is not self.cancel_event or cancel_event.is_set():
+                continue
+            if kind == "progress":
+                progress_items.append(payload)
+                continue
+            if progress_items:
+                self.on_progress(progress_items)
+                progress_items = []
+            if kind == "result":
+                self.on_result(payload)
+            elif self.on_error is not None:
+                self.on_error(payload)
+            else:
+                self.root.after(self.poll_ms, self.poll)
+                raise payload
+        if progress_items:
+            self.on_progress(progress_items)
+        self.root.after(self.poll_ms, self.poll)